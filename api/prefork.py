@@ -0,0 +1,256 @@
+# api/prefork.py
+#
+# Pre-fork worker mode for the HTTP API (Linux / macOS).
+#
+# `uvicorn --workers N` starts N fresh interpreters, and each one loads its
+# own MiniLM, TF-IDF vocabulary and hybrid SVC. Here the parent loads every
+# model once, freezes the garbage collector's view of those objects and
+# then forks the workers. The weight buffers (torch tensors, numpy arrays)
+# are never written after loading, so the workers share the parent's pages
+# copy-on-write instead of holding N copies.
+#
+# Usage (from the project root):
+#   python -m api.prefork --workers 4 --port 8000 [--memory-report 60]
+#
+# Memory per process (RSS / PSS / shared / private, from smaps_rollup) is
+# printed every --memory-report seconds and on SIGUSR1:
+#   kill -USR1 <parent pid>
+#
+# Workers that die are restarted with exponential backoff (1s doubling up
+# to 30s while they keep dying within RESTART_RESET_SECONDS of starting);
+# after --max-restarts restarts inside RESTART_WINDOW_SECONDS the
+# supervisor stops all workers and exits instead of restarting forever.
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+
+from utils.model_registry import get_bert_model, get_hybrid_predictor, process_memory, registry
+
+_MB = 1024 * 1024
+
+RESTART_BACKOFF_SECONDS = 1.0
+RESTART_BACKOFF_MAX_SECONDS = 30.0
+RESTART_RESET_SECONDS = 60.0   # a worker that lived this long resets the backoff
+RESTART_WINDOW_SECONDS = 300.0
+MAX_RESTARTS = 10
+
+
+# ----------------------------------------------------------
+# Parent: load once
+# ----------------------------------------------------------
+def preload_models():
+    """Load every model artifact and precompute what workers would build lazily."""
+    registry.load_all()
+    sbert = get_bert_model()
+    # The predictor's split weight blocks are built on first use; build them
+    # here so they are shared too
+    get_hybrid_predictor().prepare(sbert.get_sentence_embedding_dimension())
+    # ONNX backends build their session (and its thread pool) lazily, per
+    # process; one created here would leave the workers without its threads
+    if getattr(sbert, "has_session", False):
+        raise RuntimeError("The ONNX Runtime session was created before fork(); workers could deadlock")
+
+    # Everything allocated so far lives for the whole process: move it to the
+    # permanent generation so the workers' collections never touch (and
+    # copy) those pages. No forward pass runs here - a warmed-up OpenMP
+    # thread pool does not survive fork().
+    gc.collect()
+    gc.freeze()
+
+
+# ----------------------------------------------------------
+# Worker
+# ----------------------------------------------------------
+def _worker_main(sock, threads: int, log_level: str):
+    import uvicorn
+
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGUSR1, signal.SIGCHLD):
+        signal.signal(sig, signal.SIG_DFL)
+
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+    # An SQLite connection must not be shared across fork(): reopen it
+    from utils.cache import SQLiteStore
+    from utils.embedding import embedding_cache
+    if embedding_cache.disk is not None:
+        embedding_cache.disk = SQLiteStore(embedding_cache.disk.path, table=embedding_cache.disk.table)
+
+    from api.server import create_app
+    server = uvicorn.Server(uvicorn.Config(create_app(), log_level=log_level))
+    server.run(sockets=[sock])
+
+
+def _spawn(sock, threads, log_level):
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _worker_main(sock, threads, log_level)
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+# ----------------------------------------------------------
+# Memory report
+# ----------------------------------------------------------
+def memory_report(parent_pid, worker_pids) -> str:
+    """Table of per-process memory plus the total PSS across all of them."""
+    lines = [f"{'process':<16} {'RSS MB':>9} {'PSS MB':>9} {'shared MB':>10} {'private MB':>11}"]
+    total_pss = 0
+    worker_rss = []
+    for label, pid in [("parent", parent_pid)] + [(f"worker {pid}", pid) for pid in worker_pids]:
+        mem = process_memory(pid)
+        if mem is None:
+            lines.append(f"{label:<16} {'n/a':>9}")
+            continue
+        total_pss += mem["pss"]
+        if pid != parent_pid:
+            worker_rss.append(mem["rss"])
+        lines.append(
+            f"{label:<16} {mem['rss'] / _MB:>9.1f} {mem['pss'] / _MB:>9.1f} "
+            f"{mem['shared'] / _MB:>10.1f} {mem['private'] / _MB:>11.1f}"
+        )
+    if worker_rss:
+        # Unshared, every worker would hold at least its whole RSS privately
+        lines.append(
+            f"total PSS {total_pss / _MB:.1f} MB; unshared the {len(worker_rss)} workers "
+            f"would need at least {sum(worker_rss) / _MB:.1f} MB"
+        )
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------------
+# Supervisor
+# ----------------------------------------------------------
+def serve(host: str = "127.0.0.1", port: int = 8000, workers: int = None, threads: int = 1,
+          memory_interval: float = None, log_level: str = "info", max_restarts: int = MAX_RESTARTS):
+    """
+    Load models, bind once, fork `workers` API workers and keep them running.
+    Returns the process exit code (1 if workers kept crashing).
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Pre-fork mode needs os.fork(); use `uvicorn api.server:app` on this platform")
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    preload_models()
+    print(f"Models loaded in {time.perf_counter() - start:.1f}s (pid {os.getpid()})", flush=True)
+
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    children = {}      # pid -> monotonic start time
+    pending = []       # monotonic times at which to start a replacement
+    restarts = []      # monotonic times of recent restarts
+    backoff = RESTART_BACKOFF_SECONDS
+    stopping = False
+    exit_code = 0
+
+    def stop(signum=None, frame=None):
+        nonlocal stopping
+        stopping = True
+        pending.clear()
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def report(signum=None, frame=None):
+        print(memory_report(os.getpid(), sorted(children)), flush=True)
+
+    def spawn():
+        children[_spawn(sock, threads, log_level)] = time.monotonic()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGUSR1, report)
+
+    for _ in range(workers):
+        spawn()
+    print(f"Serving on http://{host}:{port} with {workers} workers: {sorted(children)}", flush=True)
+
+    next_report = time.monotonic() + memory_interval if memory_interval else None
+    while children or pending:
+        now = time.monotonic()
+        while pending and pending[0] <= now and not stopping:
+            pending.pop(0)
+            spawn()
+
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG) if children else (0, 0)
+        except ChildProcessError:
+            pid, status = 0, 0
+            children.clear()
+        if pid == 0:
+            if next_report is not None and now >= next_report:
+                report()
+                next_report += memory_interval
+            time.sleep(0.5)
+            continue
+
+        started = children.pop(pid, None)
+        if stopping or started is None:
+            continue
+
+        now = time.monotonic()
+        restarts[:] = [t for t in restarts if now - t < RESTART_WINDOW_SECONDS]
+        if len(restarts) >= max_restarts:
+            print(f"Worker {pid} exited ({os.waitstatus_to_exitcode(status)}); {len(restarts)} restarts in "
+                  f"{RESTART_WINDOW_SECONDS:.0f}s, giving up", file=sys.stderr, flush=True)
+            exit_code = 1
+            stop()
+            continue
+        restarts.append(now)
+
+        # Crash loops (e.g. a bad model file) back off instead of forking nonstop
+        if now - started >= RESTART_RESET_SECONDS:
+            backoff = RESTART_BACKOFF_SECONDS
+        delay = backoff
+        backoff = min(backoff * 2, RESTART_BACKOFF_MAX_SECONDS)
+        print(f"Worker {pid} exited ({os.waitstatus_to_exitcode(status)}); restarting in {delay:.1f}s",
+              file=sys.stderr, flush=True)
+        pending.append(now + delay)
+        pending.sort()
+
+    sock.close()
+    return exit_code
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the HTTP API from pre-forked workers sharing one model copy.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: CPUs)")
+    parser.add_argument("--threads", type=int, default=1, help="torch threads per worker")
+    parser.add_argument("--memory-report", type=float, default=None, metavar="SECONDS",
+                        help="print per-process memory every N seconds")
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--max-restarts", type=int, default=MAX_RESTARTS,
+                        help=f"give up after this many worker restarts within {RESTART_WINDOW_SECONDS:.0f}s")
+    args = parser.parse_args(argv)
+
+    return serve(args.host, args.port, workers=args.workers, threads=args.threads,
+                 memory_interval=args.memory_report, log_level=args.log_level,
+                 max_restarts=args.max_restarts)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+# api/server.py
+#
+# Headless HTTP API for the resume scorer (FastAPI).
+#
+#   GET  /health     liveness, worker pid / memory and micro-batching stats
+#   POST /classify   {"text": ...}                              -> category + probabilities
+#   POST /score      {"resume_text": ..., "job_description": ...} -> ATS score breakdown
+#   POST /rank       {"job_description": ..., "resumes": [{"id": ..., "text": ...}]}
+#
+# Requests are handled asynchronously; concurrent resumes (from any
+# endpoint) are grouped by a MicroBatcher into single SBERT + classifier
+# passes. Tune with RESUME_API_MAX_BATCH_SIZE (default 32) and
+# RESUME_API_MAX_WAIT_MS (default 10).
+#
+# Run (from the project root):
+#   uvicorn api.server:app --host 0.0.0.0 --port 8000
+#
+# In-process client (no server needed):
+#   from fastapi.testclient import TestClient
+#   with TestClient(create_app()) as client:
+#       client.post("/score", json={"resume_text": ..., "job_description": ...}).json()
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Annotated, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, Field, StringConstraints
+
+from api.service import ResumeJob, create_batcher, get_profile
+from utils.model_registry import process_memory
+from utils.scoring import final_ats_score, rank_scores, resolve_weights
+
+
+# ----------------------------------------------------------
+# Request bodies
+# ----------------------------------------------------------
+# Stripped, and rejected (422) when nothing but whitespace is left
+Text = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+class ClassifyRequest(BaseModel):
+    text: Text
+    top_k: int = Field(3, ge=1, le=50)
+
+
+class ScoreRequest(BaseModel):
+    resume_text: Text
+    job_description: Text
+    weights: Optional[Dict[str, float]] = None
+    top_k: int = Field(3, ge=1, le=50)
+
+
+class RankResume(BaseModel):
+    id: str
+    text: Text
+
+
+class RankRequest(BaseModel):
+    job_description: Text
+    resumes: List[RankResume] = Field(..., min_length=1)
+    weights: Optional[Dict[str, float]] = None
+    top_k: Optional[int] = Field(None, ge=1)
+
+
+# ----------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------
+def _check_weights(weights):
+    try:
+        resolve_weights(weights)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+async def _get_profile(job_description: str):
+    """get_profile() off the event loop: a new JD means skill extraction, clean_text and a TF-IDF transform."""
+    return await asyncio.get_running_loop().run_in_executor(None, get_profile, job_description)
+
+
+def _score_payload(result, weights):
+    """Public /score fields from an analyze_batch result."""
+    return {
+        "final_score": final_ats_score(
+            result["skill_match"], result["bert_score"], result["tfidf_sim"],
+            result["exp_score"], result["edu_score"], weights=weights,
+        ),
+        "skill_match_percent": round(result["skill_match"] * 100, 2),
+        "bert_score": result["bert_score"],
+        "tfidf_sim": result["tfidf_sim"],
+        "exp_score": result["exp_score"],
+        "edu_score": result["edu_score"],
+        "experience_years": result["experience_years"],
+        "education_level": result["education_level"],
+        "resume_skills": result["resume_skills"],
+        "missing_skills": result["missing_skills"],
+        "email": result["email"],
+        "phone": result["phone"],
+        "predicted_category": result["category"],
+        "category_probability": result["probability"],
+        "model_confidence": result["confidence"],
+    }
+
+
+# ----------------------------------------------------------
+# App
+# ----------------------------------------------------------
+def create_app(max_batch_size: int = None, max_wait_ms: float = None) -> FastAPI:
+    batcher = create_batcher(max_batch_size, max_wait_ms)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await batcher.close()
+
+    app = FastAPI(title="AI Resume Screening API", lifespan=lifespan)
+    app.state.batcher = batcher
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok", "pid": os.getpid(), "memory": process_memory(), "batching": batcher.stats()}
+
+    @app.post("/classify")
+    async def classify(req: ClassifyRequest):
+        result = await batcher.submit(ResumeJob(req.text, None, req.top_k))
+        return {
+            "category": result["category"],
+            "probability": result["probability"],
+            "confidence": result["confidence"],
+            "top_k": result["top_k"],
+        }
+
+    @app.post("/score")
+    async def score(req: ScoreRequest):
+        _check_weights(req.weights)
+        profile = await _get_profile(req.job_description)
+        result = await batcher.submit(ResumeJob(req.resume_text, profile, req.top_k))
+        payload = _score_payload(result, req.weights)
+        payload["top_k"] = result["top_k"]
+        return payload
+
+    @app.post("/rank")
+    async def rank(req: RankRequest):
+        _check_weights(req.weights)
+        profile = await _get_profile(req.job_description)
+        # Every resume goes through the shared batcher, alongside other requests
+        results = await asyncio.gather(*(
+            batcher.submit(ResumeJob(resume.text, profile, 1)) for resume in req.resumes
+        ))
+        payloads = [_score_payload(result, req.weights) for result in results]
+        order = rank_scores([p["final_score"] for p in payloads], top_k=req.top_k)
+        return {
+            "job_skills": profile.skill_list,
+            "results": [
+                {"rank": rank, "id": req.resumes[i].id, **payloads[i]}
+                for rank, i in enumerate(order, start=1)
+            ],
+        }
+
+    return app
+
+
+app = create_app()
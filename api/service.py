@@ -0,0 +1,117 @@
+# api/service.py
+#
+# Model work behind the HTTP API, independent of the web framework.
+#
+# Every /classify, /score and /rank request is turned into ResumeJobs and
+# submitted to one MicroBatcher; analyze_batch() then runs a single SBERT
+# encode, TF-IDF transform and classifier pass for all jobs in the batch.
+# Job descriptions that are not embedded yet ride along in the same
+# encode call, and JobProfiles are cached by JD text across requests.
+
+import os
+from typing import NamedTuple, Optional
+
+from sklearn.metrics.pairwise import cosine_similarity
+
+from utils.cache import LRUCache, text_key
+from utils.embedding import encode_texts, bert_similarity_from_embeddings
+from utils.features import extract_resume_features
+from utils.job_profile import JobProfile
+from utils.micro_batch import MicroBatcher
+from utils.model_registry import get_tfidf, get_hybrid_predictor
+from utils.scoring import score_experience, score_education
+
+MAX_BATCH_SIZE = int(os.environ.get("RESUME_API_MAX_BATCH_SIZE", "32"))
+MAX_WAIT_MS = float(os.environ.get("RESUME_API_MAX_WAIT_MS", "10"))
+
+profile_cache = LRUCache(int(os.environ.get("RESUME_API_PROFILE_CACHE_SIZE", "128")))
+
+
+class ResumeJob(NamedTuple):
+    text: str
+    profile: Optional[JobProfile] = None  # None: classify only
+    top_k: int = 3
+
+
+def get_profile(job_description: str) -> JobProfile:
+    """
+    JobProfile for a JD, shared by every request with the same text. Its
+    TF-IDF vector is built here too; the embedding is left to
+    analyze_batch(), which encodes it together with the resumes.
+    """
+    key = text_key(job_description, "jd")
+    profile = profile_cache.get(key)
+    if profile is None:
+        profile = JobProfile(job_description)
+        profile.tfidf_vector  # clean_text + TF-IDF transform, computed once
+        profile_cache.put(key, profile)
+    return profile
+
+
+def analyze_batch(jobs):
+    """
+    One result dict per job: category, raw margin and - only when a
+    calibration file was loaded - probabilities; for jobs with a profile
+    also the ATS component scores (final score is left to the caller,
+    which may use custom weights).
+    """
+    texts = [job.text for job in jobs]
+    features = [extract_resume_features(text) for text in texts]
+
+    # Resumes and not-yet-embedded JDs in one encode pass
+    new_profiles = list({
+        id(job.profile): job.profile
+        for job in jobs
+        if job.profile is not None and not job.profile.has_embedding
+    }.values())
+    embeddings = encode_texts(texts + [p.text for p in new_profiles])
+    for profile, vector in zip(new_profiles, embeddings[len(texts):]):
+        profile.set_embedding(vector)
+    resume_emb = embeddings[:len(texts)]
+
+    tfidf_mat = get_tfidf().transform([f.cleaned_text for f in features])
+
+    predictor = get_hybrid_predictor()
+    preds, confidences, probs = predictor.predict_all(resume_emb, tfidf_mat)
+    classes = predictor.classes_
+    calibrated = predictor.is_calibrated
+
+    results = []
+    for i, (job, feat) in enumerate(zip(jobs, features)):
+        top = probs[i].argsort()[::-1][:max(1, job.top_k)]
+        result = {
+            "category": str(preds[i]),
+            "probability": float(probs[i].max()) if calibrated else None,
+            "confidence": float(confidences[i]),
+            "top_k": [
+                {"category": str(classes[j]), "probability": float(probs[i, j]) if calibrated else None}
+                for j in top
+            ],
+            "experience_years": feat.experience_years,
+            "education_level": feat.education_level,
+            "resume_skills": list(feat.skills),
+            "email": feat.email,
+            "phone": feat.phone,
+        }
+
+        profile = job.profile
+        if profile is not None:
+            result.update(
+                skill_match=profile.skill_match(feat.skills),
+                bert_score=bert_similarity_from_embeddings(resume_emb[i], profile.embedding),
+                tfidf_sim=float(cosine_similarity(tfidf_mat[i], profile.tfidf_vector)[0][0]),
+                exp_score=score_experience(feat.experience_years, profile),
+                edu_score=score_education(feat.education_level, profile),
+                missing_skills=profile.missing_skills(feat.skills),
+            )
+        results.append(result)
+    return results
+
+
+def create_batcher(max_batch_size: int = None, max_wait_ms: float = None) -> MicroBatcher:
+    return MicroBatcher(
+        analyze_batch,
+        max_batch_size=max_batch_size or MAX_BATCH_SIZE,
+        max_wait_ms=MAX_WAIT_MS if max_wait_ms is None else max_wait_ms,
+        name="resume",
+    )
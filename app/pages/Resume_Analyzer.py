@@ -4,6 +4,7 @@
 
 import sys
 import os
+import hashlib
 from bootstrap import *   # DO NOT REMOVE — required for path fixing
 
 # Absolute project root
@@ -11,20 +12,17 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")
 sys.path.insert(0, PROJECT_ROOT)
 
 import streamlit as st
-import joblib, re, nltk
-import numpy as np
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
 from sklearn.metrics.pairwise import cosine_similarity
 import plotly.graph_objects as go
 
 # === Custom Utility Imports ===
-from utils.parser import extract_text_from_upload, extract_contact_details, extract_experience_years, extract_education_level
-from utils.skills import extract_skills
-from utils.embedding import bert_model
-from utils.embedding import compute_bert_similarity
+from utils.document_cache import parse_upload, parse_text
+from utils.text_cleaner import clean_text
+from utils.job_profile import JobProfile
+from utils.embedding import encode_texts, bert_similarity_from_embeddings, chunked_similarities
 from utils.scoring import score_experience, score_education, final_ats_score
 from utils.report import create_ats_report
+from utils.model_registry import get_tfidf, get_hybrid_predictor
 
 # Initialize dynamic uploader key
 if "uploader_key" not in st.session_state:
@@ -34,30 +32,19 @@ if "uploader_key" not in st.session_state:
 # ----------------------------------------------------------
 # Load Required Artifacts (Hybrid Model + TF-IDF)
 # ----------------------------------------------------------
-@st.cache_resource
-def load_models():
-    tfidf = joblib.load("models/tfidf_vectorizer.pkl")
-    hybrid_model = joblib.load("models/resume_hybrid_model.pkl")  # NEW
-    return tfidf, hybrid_model, bert_model
-
-tfidf, hybrid_model, bert_model = load_models()
+# Shared process-wide registry: each artifact is loaded once, on first use.
+# SBERT is only loaded when a resume is actually encoded.
+tfidf = get_tfidf()
+hybrid_predictor = get_hybrid_predictor()
 
 
 # ----------------------------------------------------------
-# NLTK Setup
+# PDF report: built only when requested, once per unique result
 # ----------------------------------------------------------
-nltk.download("stopwords", quiet=True)
-nltk.download("wordnet", quiet=True)
-
-_stop = set(stopwords.words("english"))
-_lem = WordNetLemmatizer()
-
-def clean_text(text: str) -> str:
-    text = re.sub(r"<.*?>", " ", text)
-    text = re.sub(r"[^a-zA-Z]", " ", text)
-    text = text.lower()
-    tokens = [_lem.lemmatize(w) for w in text.split() if w not in _stop]
-    return " ".join(tokens)
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_ats_report(**report_fields):
+    """Memoized on the analysis values, so reruns reuse the same PDF."""
+    return create_ats_report(**report_fields)
 
 
 # ----------------------------------------------------------
@@ -79,31 +66,57 @@ if uploaded_file is not None:
 
 resume_text = st.text_area("Or paste resume text:", height=220)
 job_description = st.text_area("Paste Job Description (Optional)", height=160)
+chunked_matching = st.checkbox(
+    "Match long resumes section by section",
+    help="Scores every section of the resume against the JD instead of only the first ~256 tokens.",
+)
+
+
+def _inputs_key():
+    """Hash of everything the analysis depends on."""
+    h = hashlib.sha256()
+    h.update(uploaded_file.getvalue() if uploaded_file is not None else b"")
+    for part in (resume_text, job_description, str(chunked_matching)):
+        h.update(b"\0" + part.encode("utf-8"))
+    return h.hexdigest()
+
+
+inputs_key = _inputs_key()
+# A stored analysis (and its report) only belongs to the inputs it was run on
+if st.session_state.get("analysis_inputs") != inputs_key:
+    st.session_state.pop("analysis", None)
+    st.session_state.pop("report_requested", None)
+    st.session_state.pop("analysis_inputs", None)
 
 
 # ----------------------------------------------------------
 #                  PROCESS PIPELINE
 # ----------------------------------------------------------
+# Results are kept in session_state so later reruns (e.g. the report
+# button) redraw them without re-running the models.
 if st.button("Analyze Resume"):
 
-    # 1️⃣ Extract Text
+    # 1️⃣ Extract Text + features (cached by content hash: identical
+    #    uploads and Streamlit reruns skip parsing entirely)
     if uploaded_file:
-        raw_resume_text = extract_text_from_upload(uploaded_file)
+        parsed = parse_upload(uploaded_file)
     elif resume_text.strip():
-        raw_resume_text = resume_text
+        parsed = parse_text(resume_text)
     else:
         st.warning("Please upload a resume or paste text.")
         st.stop()
 
+    raw_resume_text = parsed["text"]
+
     # 2️⃣ Contact Info
-    contact_info = extract_contact_details(raw_resume_text)
+    contact_info = parsed["contact"]
 
     # 3️⃣ Skills
-    resume_skills = extract_skills(raw_resume_text)
+    resume_skills = parsed["skills"]
 
     # 4️⃣ Experience + Education
-    experience_years = extract_experience_years(raw_resume_text)
-    education_level = extract_education_level(raw_resume_text)
+    experience_years = parsed["experience_years"]
+    education_level = parsed["education_level"]
 
     # ----------------------------------------------------------
     #         HYBRID PREDICTION (BERT + TF-IDF)
@@ -112,109 +125,169 @@ if st.button("Analyze Resume"):
 
         cleaned = clean_text(raw_resume_text)
 
-        # --- TF-IDF vector ---
-        tfidf_vec = tfidf.transform([cleaned]).toarray()
+        # --- TF-IDF vector (sparse, never densified) ---
+        tfidf_vec = tfidf.transform([cleaned])
+
+        # --- BERT vectors: resume (+ JD) encoded once, in one pass ---
+        # The resume vector is shared by the classifier and the JD similarity.
+        has_jd = bool(job_description.strip())
+        embeddings = encode_texts([raw_resume_text, job_description] if has_jd else [raw_resume_text])
+        bert_vec = embeddings[:1]
+
+        # JD requirements, skills and vectors are derived once, here
+        profile = JobProfile(job_description) if has_jd else None
+        if profile is not None:
+            profile.set_embedding(embeddings[1])
+
+        # --- HYBRID PREDICTION on [BERT | TF-IDF] ---
+        # Decision function = BERT block + sparse TF-IDF block of the linear model,
+        # computed once for labels, margins and probabilities
+        preds, confidences, probs = hybrid_predictor.predict_all(bert_vec, tfidf_vec)
+        pred = preds[0]
+
+        # Confidence: max decision function value (raw margin, used in the report)
+        hybrid_conf = float(confidences[0])
+
+        # Category ranking; probabilities are only meaningful when calibrated
+        probs = probs[0]
+        calibrated = hybrid_predictor.is_calibrated
+        top_categories = [
+            (hybrid_predictor.classes_[i], float(probs[i]) if calibrated else None)
+            for i in probs.argsort()[::-1][:3]
+        ]
+
+    analysis = {
+        "pred": pred,
+        "hybrid_conf": hybrid_conf,
+        "top_categories": top_categories,
+        "contact_info": contact_info,
+        "resume_skills": resume_skills,
+        "experience_years": experience_years,
+        "education_level": education_level,
+        "resume_text": raw_resume_text,
+        "match": None,
+    }
 
-        # --- BERT vector ---
-        bert_vec = bert_model.encode([raw_resume_text])
+    # ----------------------------------------------------------
+    #                  JD ANALYSIS + MATCHING
+    # ----------------------------------------------------------
+    if has_jd:
+        skill_match_percent = round(profile.skill_match(resume_skills) * 100, 2)
 
-        # --- HYBRID FEATURE = CONCAT(BERT, TF-IDF) ---
-        hybrid_vec = np.hstack((bert_vec, tfidf_vec))
+        # TF-IDF Similarity
+        tfidf_sim = float(cosine_similarity(tfidf_vec, profile.tfidf_vector)[0][0])
 
-        pred = hybrid_model.predict(hybrid_vec)[0]
+        # BERT Similarity
+        if chunked_matching:
+            bert_score = float(chunked_similarities([raw_resume_text], profile.embedding)[0])
+        else:
+            bert_score = bert_similarity_from_embeddings(embeddings[0], profile.embedding)
 
-        # Confidence: cosine similarity to training support vectors
-        decision_val = hybrid_model.decision_function(hybrid_vec)
-        hybrid_conf = float(np.max(decision_val))
+        # Final ATS Score
+        exp_score = score_experience(experience_years, profile)
+        edu_score = score_education(education_level, profile)
 
+        final_score = final_ats_score(
+            skill_match_percent/100, bert_score, tfidf_sim, exp_score, edu_score
+        )
+
+        analysis["match"] = {
+            "jd_skills": profile.skill_list,
+            "skill_match_percent": skill_match_percent,
+            "tfidf_sim": tfidf_sim,
+            "bert_score": bert_score,
+            "exp_score": exp_score,
+            "edu_score": edu_score,
+            "final_score": final_score,
+            "missing_skills": profile.missing_skills(resume_skills),
+        }
+
+    st.session_state["analysis"] = analysis
+    st.session_state["analysis_inputs"] = inputs_key
+    st.session_state["report_requested"] = False
+
+
+# ----------------------------------------------------------
+#               DISPLAY RESULTS
+# ----------------------------------------------------------
+analysis = st.session_state.get("analysis")
+if analysis is not None:
+
+    pred = analysis["pred"]
+    top_categories = analysis["top_categories"]
 
-    # ----------------------------------------------------------
-    #               DISPLAY PREDICTION RESULTS
-    # ----------------------------------------------------------
     st.success(f"Predicted Category: **{pred}**")
-    st.info(f"Hybrid Model Confidence: **{hybrid_conf:.2f}**")
+    if top_categories[0][1] is not None:
+        st.info(f"Hybrid Model Confidence: **{top_categories[0][1] * 100:.1f}%** (raw margin {analysis['hybrid_conf']:.2f})")
+    else:
+        # No calibration file: a softmax of SVM margins is not a probability
+        st.info(f"Hybrid Model Confidence (raw margin): **{analysis['hybrid_conf']:.2f}**")
+
+    with st.expander("📊 Top Categories"):
+        for category, prob in top_categories:
+            st.write(f"**{category}**: {prob * 100:.1f}%" if prob is not None else f"**{category}**")
 
 
     # Contact Info
     with st.expander("📬 Contact Info"):
-        st.write(contact_info)
+        st.write(analysis["contact_info"])
 
     # Skills
+    resume_skills = analysis["resume_skills"]
     with st.expander("🛠 Skills Detected in Resume"):
         st.write(", ".join(resume_skills) if resume_skills else "No skills detected")
 
     # Experience/Education
     with st.expander("🎓 Experience & Education"):
-        st.write(f"**Years of Experience:** {experience_years}")
-        st.write(f"**Education Level:** {education_level}")
-
+        st.write(f"**Years of Experience:** {analysis['experience_years']}")
+        st.write(f"**Education Level:** {analysis['education_level']}")
 
-    # ----------------------------------------------------------
-    #                  JD ANALYSIS + MATCHING
-    # ----------------------------------------------------------
-    if job_description.strip():
 
-        jd_skills = extract_skills(job_description)
-        matched = len(set(resume_skills) & set(jd_skills))
-        total = len(jd_skills)
-        skill_match_percent = round((matched / total) * 100, 2) if total else 0
-        st.metric("Skill Match %", f"{skill_match_percent}%")
-        
+    match = analysis["match"]
+    if match is not None:
 
+        st.metric("Skill Match %", f"{match['skill_match_percent']}%")
+        st.metric("TF-IDF Similarity", f"{round(match['tfidf_sim'] * 100, 2)}%")
+        st.metric("BERT Similarity", f"{round(match['bert_score'] * 100, 2)}%")
 
-        # TF-IDF Similarity
-        jd_clean = clean_text(job_description)
-        jd_vec = tfidf.transform([jd_clean])
-        tfidf_sim = float(cosine_similarity(tfidf_vec, jd_vec)[0][0])
-
-        # BERT Similarity
-        bert_score = compute_bert_similarity(raw_resume_text, job_description)
-
-        st.metric("TF-IDF Similarity", f"{round(tfidf_sim * 100, 2)}%")
-        st.metric("BERT Similarity", f"{round(bert_score * 100, 2)}%")
-
-
-        # Final ATS Score
-        exp_score = score_experience(experience_years, job_description)
-        edu_score = score_education(education_level, job_description)
-
-        final_score = final_ats_score(
-            skill_match_percent/100, bert_score, tfidf_sim, exp_score, edu_score
-        )
-
-        st.markdown(f"## ⭐ Final ATS Score: **{final_score}%**")
+        st.markdown(f"## ⭐ Final ATS Score: **{match['final_score']}%**")
 
 
         # Missing Skills
-        missing_skills = set(jd_skills) - set(resume_skills)
+        missing_skills = match["missing_skills"]
         with st.expander("❌ Missing Skills"):
             st.write(", ".join(missing_skills) if missing_skills else "No missing skills!")
 
 
         # ------------------------------------------------------
-        #       PDF REPORT DOWNLOAD
+        #       PDF REPORT DOWNLOAD (on request)
         # ------------------------------------------------------
-        report_bytes = create_ats_report(
-            final_score=final_score,
-            skill_match_percent=skill_match_percent,
-            bert_score=bert_score,
-            tfidf_sim=tfidf_sim,
-            exp_score=exp_score,
-            edu_score=edu_score,
-            experience_years=experience_years,
-            education_level=education_level,
-            resume_skills=resume_skills,
-            resume_text=raw_resume_text,
-            jd_skills=jd_skills,
-            missing_skills=missing_skills,
-            predicted_category=pred,
-            model_confidence= hybrid_conf,
-            contact_info=contact_info,
-        )
-
-        st.download_button(
-            label="📄 Download ATS Report",
-            data=report_bytes,
-            file_name="ATS_Resume_Report.pdf",
-            mime="application/pdf",
-        )
\ No newline at end of file
+        if st.button("📄 Prepare ATS Report"):
+            st.session_state["report_requested"] = True
+
+        if st.session_state.get("report_requested"):
+            with st.spinner("Building PDF report..."):
+                report_bytes = build_ats_report(
+                    final_score=match["final_score"],
+                    skill_match_percent=match["skill_match_percent"],
+                    bert_score=match["bert_score"],
+                    tfidf_sim=match["tfidf_sim"],
+                    exp_score=match["exp_score"],
+                    edu_score=match["edu_score"],
+                    experience_years=analysis["experience_years"],
+                    education_level=analysis["education_level"],
+                    resume_skills=resume_skills,
+                    resume_text=analysis["resume_text"],
+                    jd_skills=match["jd_skills"],
+                    missing_skills=missing_skills,
+                    predicted_category=pred,
+                    model_confidence=analysis["hybrid_conf"],
+                    contact_info=analysis["contact_info"],
+                )
+
+            st.download_button(
+                label="📄 Download ATS Report",
+                data=report_bytes,
+                file_name="ATS_Resume_Report.pdf",
+                mime="application/pdf",
+            )
@@ -0,0 +1,70 @@
+# benchmarks/_corpus.py
+#
+# Deterministic synthetic resumes for the benchmarks, or real ones from a folder
+# of .txt files (one resume per file).
+
+import os
+import random
+
+_SECTIONS = [
+    "Professional Summary",
+    "Work Experience",
+    "Education",
+    "Skills",
+    "Projects",
+    "Certifications",
+]
+
+_PHRASES = [
+    "Responsible for designing and maintaining data pipelines in Python and SQL",
+    "Led a team of 5 engineers building machine learning models with TensorFlow and PyTorch",
+    "Worked on dashboards in Power BI and Tableau for business stakeholders",
+    "Managed accounts receivable, payroll and monthly financial reporting",
+    "Provided patient care, medication administration and clinical documentation",
+    "Deployed microservices on AWS and Azure using Docker and Kubernetes",
+    "Improved customer retention by 15% through targeted marketing campaigns",
+    "Assisted teachers with classroom management and curriculum planning",
+    "Developed REST APIs in Java and JavaScript with PostgreSQL and MongoDB backends",
+    "Performed statistical analyses and predictive analytics with pandas and scikit-learn",
+    "Negotiated contracts with vendors and coordinated logistics across warehouses",
+    "Strong communication, leadership and problem solving skills",
+]
+
+_DEGREES = [
+    "Bachelor of Science in Computer Science",
+    "Master of Business Administration (MBA)",
+    "PhD in Statistics",
+    "Associate Degree in Nursing",
+    "B.Tech in Electrical Engineering",
+    "M.Sc in Data Science",
+]
+
+
+def synthetic_resume(rng: random.Random) -> str:
+    lines = [f"Candidate {rng.randint(1000, 9999)}"]
+    lines.append(f"candidate{rng.randint(1, 10**6)}@example.com | +1 (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}")
+    for section in _SECTIONS:
+        lines.append(section.upper())
+        if section == "Education":
+            lines.append(rng.choice(_DEGREES))
+        elif section == "Work Experience":
+            lines.append(f"{rng.randint(1, 15)}+ years of experience")
+        for _ in range(rng.randint(3, 8)):
+            lines.append("• " + rng.choice(_PHRASES) + ".")
+    return "\n".join(lines)
+
+
+def load_corpus(n: int = 1000, folder: str = None, seed: int = 42):
+    """`n` resumes: the .txt files in `folder` (cycled), else synthetic ones."""
+    if folder:
+        texts = []
+        for name in sorted(os.listdir(folder)):
+            if name.lower().endswith(".txt"):
+                with open(os.path.join(folder, name), "r", encoding="utf-8", errors="ignore") as fh:
+                    texts.append(fh.read())
+        if not texts:
+            raise ValueError(f"No .txt resumes found in {folder}")
+        return [texts[i % len(texts)] for i in range(n)]
+
+    rng = random.Random(seed)
+    return [synthetic_resume(rng) for _ in range(n)]
@@ -0,0 +1,61 @@
+# benchmarks/bench_api.py
+#
+# HTTP API throughput with and without micro-batching: N concurrent clients
+# each POST /score for distinct resumes (so the embedding cache never hits)
+# through the in-process test client.
+#
+# Usage (from the project root):
+#   python benchmarks/bench_api.py --n 256 --clients 32 [--max-batch-size 32 --max-wait-ms 10]
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.testclient import TestClient
+
+from benchmarks._corpus import load_corpus
+from api.server import create_app
+
+JD = "Data scientist with 3+ years of Python, SQL and machine learning experience. Master's degree preferred."
+
+
+def _run(label, resumes, clients, max_batch_size, max_wait_ms):
+    with TestClient(create_app(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)) as client:
+        client.post("/score", json={"resume_text": f"warm-up {label}", "job_description": JD})
+
+        def call(text):
+            return client.post("/score", json={"resume_text": text, "job_description": JD}).status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            codes = list(pool.map(call, [f"{text}\n{label}" for text in resumes]))
+        elapsed = time.perf_counter() - start
+        stats = client.get("/health").json()["batching"]
+
+    ok = sum(code == 200 for code in codes)
+    print(f"{label:<22} {elapsed:8.2f}s  {len(resumes) / elapsed:8.1f} req/s  "
+          f"ok={ok}/{len(resumes)}  mean batch={stats['mean_batch_size']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP API micro-batching benchmark")
+    parser.add_argument("--n", type=int, default=256, help="number of requests")
+    parser.add_argument("--clients", type=int, default=32, help="concurrent clients")
+    parser.add_argument("--folder", help="folder of .txt resumes (default: synthetic)")
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    resumes = load_corpus(args.n, args.folder)
+    print(f"{args.n} requests, {args.clients} concurrent clients, {os.cpu_count()} CPUs\n")
+
+    _run("unbatched (size 1)", resumes, args.clients, 1, 0)
+    _run(f"batched (size {args.max_batch_size})", resumes, args.clients, args.max_batch_size, args.max_wait_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmarks/bench_chunked.py
+#
+# Chunked long-resume similarity: cost of the first scoring pass (all chunks
+# encoded) vs re-scoring the same resumes against new JDs (chunk matrices
+# come from the cache, only the JD is encoded).
+#
+# Usage (from the project root):
+#   python benchmarks/bench_chunked.py --n 200 --pages 4 [--pooling topk]
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks._corpus import load_corpus
+from utils.embedding import POOLING_MODES, chunked_similarities, encode_chunks, encode_texts
+
+JDS = [
+    "Data scientist with 3+ years of Python, SQL and machine learning experience.",
+    "Registered nurse for patient care, medication administration and clinical documentation.",
+    "Accountant handling payroll, accounts receivable and monthly financial reporting.",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="chunked embedding benchmark")
+    parser.add_argument("--n", type=int, default=200, help="number of resumes")
+    parser.add_argument("--pages", type=int, default=4, help="synthetic resumes concatenated per candidate")
+    parser.add_argument("--folder", help="folder of .txt resumes (default: synthetic)")
+    parser.add_argument("--pooling", choices=POOLING_MODES, default="topk")
+    args = parser.parse_args()
+
+    base = load_corpus(args.n * args.pages, args.folder)
+    resumes = ["\n".join(base[i * args.pages:(i + 1) * args.pages]) for i in range(args.n)]
+    n_chunks = sum(len(m) for m in encode_chunks(resumes[:1])) * args.n
+    print(f"{args.n} resumes, ~{sum(len(r.split()) for r in resumes) // args.n} words each, ~{n_chunks} chunks\n")
+
+    for round_, jd in enumerate(JDS):
+        start = time.perf_counter()
+        jd_emb = encode_texts([jd])[0]
+        sims = chunked_similarities(resumes, jd_emb, pooling=args.pooling)
+        elapsed = time.perf_counter() - start
+        label = "first JD (encode chunks)" if round_ == 0 else f"new JD #{round_} (cached chunks)"
+        print(f"{label:<32} {elapsed:8.3f}s  best={sims.max():.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_clean_text.py
+#
+# Tokens/second of utils.text_cleaner.clean_text vs the previous
+# three-pass re.sub + per-token WordNetLemmatizer implementation.
+#
+# Usage (from the project root):
+#   python benchmarks/bench_clean_text.py --n 2000 [--folder resumes_txt/]
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks._corpus import load_corpus
+from utils.lemmatizer import lemmatize
+from utils.text_cleaner import clean_text, clean_many, stop_words
+
+
+def legacy_clean_text(text: str) -> str:
+    """The original implementation (uncompiled patterns, uncached lemmas)."""
+    if not isinstance(text, str):
+        return ""
+    text = re.sub(r'<.*?>', ' ', text)
+    text = re.sub(r'[^a-zA-Z]', ' ', text)
+    text = text.lower()
+    tokens = text.split()
+    tokens = [lemmatize(w) for w in tokens if w not in stop_words]
+    return " ".join(tokens)
+
+
+def _bench(label, fn, corpus, n_tokens):
+    start = time.perf_counter()
+    out = fn(corpus)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s  {n_tokens / elapsed:>12,.0f} tokens/s")
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="clean_text throughput benchmark")
+    parser.add_argument("--n", type=int, default=2000, help="number of resumes")
+    parser.add_argument("--folder", help="folder of .txt resumes (default: synthetic)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.n, args.folder)
+    n_tokens = sum(len(re.findall(r"[a-zA-Z]+", t)) for t in corpus)
+    print(f"{len(corpus)} resumes, {n_tokens:,} input tokens\n")
+
+    lemmatize("warmup")  # load the lemma tables outside the timed region
+
+    legacy = _bench("legacy clean_text", lambda c: [legacy_clean_text(t) for t in c], corpus, n_tokens)
+    fast = _bench("clean_text", lambda c: [clean_text(t) for t in c], corpus, n_tokens)
+    bulk = _bench("clean_many (warm cache)", clean_many, corpus, n_tokens)
+
+    assert legacy == fast == bulk, "outputs differ"
+
+
+if __name__ == "__main__":
+    main()
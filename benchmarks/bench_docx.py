@@ -0,0 +1,88 @@
+# benchmarks/bench_docx.py
+#
+# In-memory DOCX extraction (utils.parser.extract_text_from_docx_bytes) vs the
+# previous temp-file + docx2txt.process path, on generated documents.
+#
+# Usage (from the project root):
+#   python benchmarks/bench_docx.py --paragraphs 20000 [--file some.docx]
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import docx2txt
+
+from utils.parser import extract_text_from_docx_bytes
+
+_W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def _paragraph(i):
+    return (
+        f"<w:p><w:r><w:t>Line {i}: Built data pipelines in Python</w:t><w:tab/>"
+        f"<w:t xml:space=\"preserve\"> and SQL, </w:t><w:br/><w:t>5+ years</w:t></w:r></w:p>"
+    )
+
+
+def make_docx(paragraphs: int) -> bytes:
+    """A DOCX with a header, footer, a table and `paragraphs` body paragraphs."""
+    body = "".join(_paragraph(i) for i in range(paragraphs))
+    table = "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell A</w:t></w:r></w:p></w:tc>" \
+            "<w:tc><w:p><w:r><w:t>Cell B</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", "<Types/>")
+        z.writestr("word/document.xml", f"<w:document {_W}><w:body>{body}{table}</w:body></w:document>")
+        z.writestr("word/header1.xml", f"<w:hdr {_W}><w:p><w:r><w:t>Jane Doe - Resume</w:t></w:r></w:p></w:hdr>")
+        z.writestr("word/footer1.xml", f"<w:ftr {_W}><w:p><w:r><w:t>Page</w:t></w:r></w:p></w:ftr>")
+    return buf.getvalue()
+
+
+def docx2txt_tempfile(file_bytes: bytes) -> str:
+    """The previous implementation."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
+        tmp.write(file_bytes)
+        tmp_path = tmp.name
+    try:
+        return docx2txt.process(tmp_path)
+    finally:
+        os.remove(tmp_path)
+
+
+def _bench(label, fn, data, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        out = fn(data)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<24} {elapsed * 1000:9.1f} ms/doc")
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DOCX extraction benchmark")
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--file", help="benchmark a real .docx instead of a generated one")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "rb") as fh:
+            data = fh.read()
+    else:
+        data = make_docx(args.paragraphs)
+    print(f"document: {len(data) / 1024:.0f} KB compressed\n")
+
+    old = _bench("docx2txt + temp file", docx2txt_tempfile, data, args.repeat)
+    new = _bench("in-memory iterparse", extract_text_from_docx_bytes, data, args.repeat)
+
+    print("\noutputs identical:", old == new)
+
+
+if __name__ == "__main__":
+    main()
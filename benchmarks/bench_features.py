@@ -0,0 +1,67 @@
+# benchmarks/bench_features.py
+#
+# utils.features.extract_resume_features (one call, one tokenization) vs the separate
+# extract_contact_details / extract_experience_years / extract_education_level /
+# extract_skills / clean_text calls, on N resumes.
+#
+# Usage (from the project root):
+#   python benchmarks/bench_features.py --n 10000 [--folder resumes_txt/]
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks._corpus import load_corpus
+from utils.features import extract_resume_features
+from utils.parser import extract_contact_details, extract_experience_years, extract_education_level
+from utils.skills import extract_skills
+from utils.text_cleaner import clean_text
+
+
+def separate_calls(text):
+    contact = extract_contact_details(text)
+    return (
+        contact["email"],
+        contact["phone"],
+        extract_experience_years(text),
+        extract_education_level(text),
+        extract_skills(text),
+        clean_text(text),
+    )
+
+
+def one_call(text):
+    f = extract_resume_features(text)
+    return (f.email, f.phone, f.experience_years, f.education_level, f.skills, f.cleaned_text)
+
+
+def _bench(label, fn, corpus):
+    start = time.perf_counter()
+    out = [fn(t) for t in corpus]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {elapsed:8.3f}s  {len(corpus) / elapsed:>10,.0f} resumes/s")
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume feature extraction benchmark")
+    parser.add_argument("--n", type=int, default=10000, help="number of resumes")
+    parser.add_argument("--folder", help="folder of .txt resumes (default: synthetic)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.n, args.folder)
+    print(f"{len(corpus)} resumes\n")
+
+    one_call(corpus[0])  # build matcher / lemma tables outside the timed region
+
+    old = _bench("separate functions", separate_calls, corpus)
+    new = _bench("extract_resume_features", one_call, corpus)
+
+    print("\noutputs identical:", old == new)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_hybrid_predict.py
+#
+# Hybrid classifier throughput: dense np.hstack((bert, tfidf.toarray()))
+# + model.predict/decision_function vs the sparse-native HybridPredictor.
+#
+# The BERT block is random unit vectors so SBERT isn't needed; the TF-IDF
+# block comes from the real vectorizer on the benchmark corpus.
+#
+# Usage (from the project root):
+#   python benchmarks/bench_hybrid_predict.py --n 5000 [--folder resumes_txt/]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks._corpus import load_corpus
+from utils.model_registry import get_tfidf, get_hybrid_model, get_hybrid_predictor
+from utils.text_cleaner import clean_many
+
+
+def main():
+    parser = argparse.ArgumentParser(description="hybrid prediction benchmark")
+    parser.add_argument("--n", type=int, default=5000, help="number of resumes")
+    parser.add_argument("--folder", help="folder of .txt resumes (default: synthetic)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.n, args.folder)
+    tfidf_mat = get_tfidf().transform(clean_many(corpus))
+    model = get_hybrid_model()
+    predictor = get_hybrid_predictor()
+
+    bert_dim = model.coef_.shape[1] - tfidf_mat.shape[1]
+    rng = np.random.default_rng(0)
+    bert = rng.standard_normal((len(corpus), bert_dim)).astype(np.float32)
+    bert /= np.linalg.norm(bert, axis=1, keepdims=True)
+    print(f"{len(corpus)} resumes, {bert_dim} BERT + {tfidf_mat.shape[1]} TF-IDF features\n")
+
+    start = time.perf_counter()
+    hybrid = np.hstack((bert, tfidf_mat.toarray()))
+    dense_labels = model.predict(hybrid)
+    dense_scores = model.decision_function(hybrid)
+    dense_elapsed = time.perf_counter() - start
+    print(f"{'dense hstack':<20} {dense_elapsed:8.3f}s  {len(corpus) / dense_elapsed:>10,.0f} resumes/s"
+          f"  ({hybrid.nbytes / 1024 / 1024:,.0f} MB feature matrix)")
+
+    start = time.perf_counter()
+    sparse_labels, _ = predictor.predict_with_confidence(bert, tfidf_mat)
+    sparse_scores = predictor.decision_function(bert, tfidf_mat)
+    sparse_elapsed = time.perf_counter() - start
+    print(f"{'sparse-native':<20} {sparse_elapsed:8.3f}s  {len(corpus) / sparse_elapsed:>10,.0f} resumes/s")
+
+    assert np.array_equal(dense_labels, sparse_labels), "labels differ"
+    print(f"\nlabels identical, max |decision diff| = {np.abs(dense_scores - sparse_scores).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
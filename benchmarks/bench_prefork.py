@@ -0,0 +1,132 @@
+# benchmarks/bench_prefork.py
+#
+# Memory of N API workers: pre-forked from one parent that loaded the models
+# (api/prefork.py) vs N independent `uvicorn api.server:app` processes that
+# each load their own copy. Every worker serves a few /score requests first,
+# then PSS (RSS with shared pages split between processes) is summed.
+#
+# Usage (from the project root, Linux):
+#   python benchmarks/bench_prefork.py --workers 4
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from benchmarks._corpus import load_corpus
+from utils.model_registry import process_memory
+
+_MB = 1024 * 1024
+JD = "Data scientist with 3+ years of Python, SQL and machine learning experience."
+
+
+def _post(port, path, body, timeout=120):
+    req = urllib.request.Request(
+        f"http://127.0.0.1:{port}{path}", data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.load(resp)
+
+
+def _get(port, path, timeout=120):
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=timeout) as resp:
+        return json.load(resp)
+
+
+def _wait_ready(port, deadline=300):
+    end = time.monotonic() + deadline
+    while time.monotonic() < end:
+        try:
+            return _get(port, "/health", timeout=5)
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def _exercise(ports, resumes):
+    for i, text in enumerate(resumes):
+        _post(ports[i % len(ports)], "/score", {"resume_text": text, "job_description": JD})
+
+
+def _pss(pids):
+    mems = [process_memory(pid) for pid in pids]
+    return sum(m["pss"] for m in mems if m), mems
+
+
+def _children(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as fh:
+            return [int(p) for p in fh.read().split()]
+    except OSError:
+        return []
+
+
+def _stop(procs):
+    for proc in procs:
+        proc.send_signal(signal.SIGTERM)
+    for proc in procs:
+        proc.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pre-fork vs independent worker memory")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=32, help="/score requests spread over the workers")
+    parser.add_argument("--port", type=int, default=8650)
+    args = parser.parse_args()
+
+    resumes = load_corpus(args.requests)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+
+    # --- pre-forked: one port, the kernel spreads connections over workers ---
+    parent = subprocess.Popen(
+        [sys.executable, "-m", "api.prefork", "--workers", str(args.workers),
+         "--port", str(args.port), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+    try:
+        _wait_ready(args.port)
+        _exercise([args.port], resumes)
+        workers = _children(parent.pid)
+        prefork_total, prefork_mems = _pss([parent.pid] + workers)
+    finally:
+        _stop([parent])
+
+    # --- independent: one interpreter (and model copy) per worker ---
+    ports = [args.port + 1 + i for i in range(args.workers)]
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "api.server:app", "--port", str(port), "--log-level", "warning"],
+            cwd=ROOT, env=env,
+        )
+        for port in ports
+    ]
+    try:
+        for port in ports:
+            _wait_ready(port)
+        _exercise(ports, resumes)
+        independent_total, independent_mems = _pss([proc.pid for proc in procs])
+    finally:
+        _stop(procs)
+
+    print(f"\n{args.workers} workers, {args.requests} /score requests\n")
+    for label, mems in (("pre-fork", prefork_mems), ("independent", independent_mems)):
+        for i, mem in enumerate(mems):
+            if mem:
+                name = f"{label} {'parent' if label == 'pre-fork' and i == 0 else 'worker'}"
+                print(f"{name:<22} rss={mem['rss'] / _MB:7.1f} MB  pss={mem['pss'] / _MB:7.1f} MB  "
+                      f"private={mem['private'] / _MB:7.1f} MB")
+    print(f"\ntotal PSS  pre-fork: {prefork_total / _MB:.1f} MB   independent: {independent_total / _MB:.1f} MB   "
+          f"saved: {(independent_total - prefork_total) / _MB:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# benchmarks/bench_reports.py
+#
+# ATS PDF reports per second:
+#   legacy     FPDF.add_font (full TTF parse) twice per report
+#   cached     fonts parsed once per process (utils.report.register_report_fonts)
+#   pool       generate_reports() across worker processes
+#
+# Usage (from the project root):
+#   python benchmarks/bench_reports.py --n 100 [--workers 4]
+#   python benchmarks/bench_reports.py --check     # correctness check only
+#
+# Both modes check that cached-font reports match add_font ones byte for
+# byte, including two different unicode reports rendered in one process
+# (each document must get its own glyph subset). Exits 1 on a mismatch.
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks._corpus import load_corpus
+import utils.report as report
+
+# Timestamp and the trailer file ID derived from it differ between runs
+_VOLATILE_RE = re.compile(rb"/CreationDate \(D:[^)]*\)|/ID \[<[0-9A-Fa-f]*><[0-9A-Fa-f]*>\]")
+
+
+def _records(n):
+    records = []
+    for i, text in enumerate(load_corpus(n)):
+        records.append(dict(
+            final_score=50 + i % 50,
+            skill_match_percent=60.0,
+            bert_score=0.55,
+            tfidf_sim=0.35,
+            exp_score=0.8,
+            edu_score=1.0,
+            experience_years=i % 12,
+            education_level="Master's",
+            resume_skills=["python", "sql", "aws", "tableau"],
+            jd_skills=["python", "sql", "docker"],
+            missing_skills=["docker"],
+            predicted_category="data-science",
+            model_confidence=1.1,
+            contact_info={"email": f"candidate{i}@example.com", "phone": None},
+            resume_text=text,
+        ))
+    return records
+
+
+# Non-Latin-1 text in every field that reaches the PDF
+_UNICODE_TEXTS = [
+    "Zürich — naïve résumé: Python, SQL, “quoted” ≥ 5 years, Ελληνικά, Кириллица.",
+    "Łódź → São Paulo • ½ time • Ærøskøbing • Ünïcödé • 数据 (missing glyphs) • €100k.",
+]
+
+
+def _unicode_records():
+    records = _records(len(_UNICODE_TEXTS))
+    for record, text in zip(records, _UNICODE_TEXTS):
+        record.update(
+            resume_text=(text + "\n") * 20,
+            resume_skills=["python", "sql", text.split()[0]],
+            missing_skills=[text.split()[-1]],
+            contact_info={"email": "jörg@example.com", "phone": None},
+        )
+    return records
+
+
+def _legacy_register(pdf):
+    for style in report.FONT_STYLES:
+        pdf.add_font(report.FONT_FAMILY, style, report.FONT_PATH)
+
+
+def _bench(label, fn, n):
+    start = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} {elapsed:8.2f}s  {n / elapsed:8.1f} reports/s")
+    return out
+
+
+def _same_as_legacy(records) -> bool:
+    """Render `records` with add_font and with the font cache, back to back."""
+    cached_register = report.register_report_fonts
+    report.register_report_fonts = _legacy_register
+    try:
+        legacy = [report.create_ats_report(**r) for r in records]
+    finally:
+        report.register_report_fonts = cached_register
+    cached = [report.create_ats_report(**r) for r in records]
+    return all(_VOLATILE_RE.sub(b"", a) == _VOLATILE_RE.sub(b"", b) for a, b in zip(legacy, cached))
+
+
+def check() -> bool:
+    # The header prints the time to the minute; rendering back to back keeps
+    # legacy and cached copies within the same minute
+    ok = True
+    for label, records in (("ascii", _records(5)), ("unicode", _unicode_records())):
+        same = _same_as_legacy(records)
+        ok = ok and same
+        print(f"{label:<8} cached-font PDFs byte-identical to add_font (ignoring timestamp / file ID): {same}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF report throughput benchmark")
+    parser.add_argument("--n", type=int, default=100, help="number of reports")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes for the pool run")
+    parser.add_argument("--check", action="store_true", help="only run the correctness check")
+    args = parser.parse_args()
+
+    print(f"fpdf2 {report.FPDF_VERSION}, font cache {'on' if report._FONT_CACHE_SUPPORTED else 'off'}")
+    if args.check:
+        return 0 if check() else 1
+
+    records = _records(args.n)
+    print(f"{args.n} reports, {os.cpu_count()} CPUs\n")
+
+    cached_register = report.register_report_fonts
+    report.register_report_fonts = _legacy_register
+    _bench("legacy (add_font)", lambda: [report.create_ats_report(**r) for r in records], args.n)
+    report.register_report_fonts = cached_register
+
+    _bench("cached fonts", lambda: list(report.generate_reports(records, workers=1)), args.n)
+    _bench(f"pool ({args.workers} workers)", lambda: list(report.generate_reports(records, workers=args.workers)), args.n)
+
+    print()
+    return 0 if check() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+# benchmarks/bench_resume_index.py
+#
+# ResumeIndex ingest and top-k search speed, plus a consistency check of
+# add() / remove() / compact() (duplicate ids in one add() call must leave a
+# single live row that remove() takes out of search results).
+#
+# Usage (from the project root):
+#   python benchmarks/bench_resume_index.py --n 2000 [--k 10]
+#   python benchmarks/bench_resume_index.py --check     # consistency check only
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks._corpus import load_corpus
+from utils.resume_index import ResumeIndex
+
+JD = "Data scientist with 3+ years of Python, SQL and machine learning experience. Master's degree preferred."
+
+
+def check() -> bool:
+    texts = load_corpus(3)
+    with tempfile.TemporaryDirectory() as path:
+        index = ResumeIndex(path)
+        index.add(["a", "a", "b"], texts)
+        ok = len(index) == 2 and sorted(index.search(JD, k=10)["id"]) == ["a", "b"]
+
+        index.remove(["a"])
+        ok = ok and list(index.search(JD, k=10)["id"]) == ["b"]
+
+        index.compact()
+        ok = ok and index.ids == ["b"] and list(ResumeIndex(path).search(JD, k=10)["id"]) == ["b"]
+    print(f"duplicate ids / remove / compact consistent: {ok}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume index benchmark")
+    parser.add_argument("--n", type=int, default=2000, help="number of resumes to index")
+    parser.add_argument("--k", type=int, default=10, help="results per search")
+    parser.add_argument("--folder", help="folder of .txt resumes (default: synthetic)")
+    parser.add_argument("--check", action="store_true", help="only run the consistency check")
+    args = parser.parse_args()
+
+    if not args.check:
+        texts = load_corpus(args.n, args.folder)
+        with tempfile.TemporaryDirectory() as path:
+            index = ResumeIndex(path)
+            start = time.perf_counter()
+            index.add([f"cand-{i}" for i in range(len(texts))], texts)
+            index.save()
+            elapsed = time.perf_counter() - start
+            print(f"{'add + save':<12} {elapsed:8.2f}s  {len(texts) / elapsed:8.1f} resumes/s")
+
+            index.search(JD, k=args.k)  # JD embedding / TF-IDF warm-up
+            start = time.perf_counter()
+            for _ in range(10):
+                index.search(JD, k=args.k)
+            print(f"{'search':<12} {(time.perf_counter() - start) / 10 * 1000:8.1f}ms over {len(index)} resumes\n")
+
+    return 0 if check() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# benchmarks/bench_sbert_backends.py
+#
+# SBERT backend comparison: throughput (sentences/s) and embedding drift
+# of the int8 / ONNX backends against full-precision PyTorch.
+#
+# Drift is reported as
+#   cosine(backend vector, torch vector) for the same text (1.0 = identical)
+#   max |change| in resume-vs-JD cosine similarity (what the ATS score uses)
+#   top-1 agreement of the best-matching JD per resume
+#
+# Usage (from the project root; export the ONNX files first for onnx*):
+#   python -m utils.sbert_backends --export --quantize
+#   python benchmarks/bench_sbert_backends.py --n 2000 [--backends torch int8 onnx onnx-int8]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks._corpus import load_corpus
+from utils.model_registry import sbert_source
+from utils.sbert_backends import BACKENDS, load_sbert
+
+
+def _sentences(n, folder):
+    """`n` sentence-length texts (resume lines), plus the full resumes."""
+    resumes = load_corpus(max(n // 10, 50), folder)
+    lines = [line.strip("• .") for text in resumes for line in text.splitlines() if len(line) > 20]
+    sentences = [f"{lines[i % len(lines)]} ({i})" for i in range(n)]  # distinct texts
+    return sentences, resumes
+
+
+def _encode(model, texts, batch_size):
+    start = time.perf_counter()
+    emb = model.encode(texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False)
+    return np.asarray(emb, dtype=np.float32), time.perf_counter() - start
+
+
+def _unit(mat):
+    return mat / np.maximum(np.linalg.norm(mat, axis=1, keepdims=True), 1e-12)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SBERT backend throughput / drift benchmark")
+    parser.add_argument("--n", type=int, default=2000, help="number of sentences")
+    parser.add_argument("--folder", help="folder of .txt resumes (default: synthetic)")
+    parser.add_argument("--model", help="model folder (default: the configured local SBERT)")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    source = args.model or sbert_source()
+    sentences, resumes = _sentences(args.n, args.folder)
+    jds, resumes = resumes[:10], resumes[10:]
+    print(f"{len(sentences)} sentences, {len(resumes)} resumes x {len(jds)} JDs, model: {source}\n")
+
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+    reference = None
+    header = f"{'backend':<10} {'load s':>7} {'sent/s':>9} {'resumes/s':>10} {'cos mean':>9} {'cos min':>9} {'max dsim':>9} {'top1':>6}"
+    print(header)
+    print("-" * len(header))
+
+    for backend in backends:
+        try:
+            start = time.perf_counter()
+            model = load_sbert(source, backend)
+            load_seconds = time.perf_counter() - start
+        except (ImportError, FileNotFoundError) as exc:
+            print(f"{backend:<10} skipped: {exc}")
+            continue
+
+        model.encode(sentences[:args.batch_size], batch_size=args.batch_size)  # warm-up
+        sent_emb, sent_seconds = _encode(model, sentences, args.batch_size)
+        resume_emb, resume_seconds = _encode(model, resumes, args.batch_size)
+        jd_emb, _ = _encode(model, jds, args.batch_size)
+        sims = _unit(resume_emb) @ _unit(jd_emb).T
+
+        if reference is None:
+            reference = (sent_emb, sims)
+            drift = ("-", "-", "-", "-")
+        else:
+            per_text = np.sum(_unit(sent_emb) * _unit(reference[0]), axis=1)
+            drift = (
+                f"{per_text.mean():.5f}",
+                f"{per_text.min():.5f}",
+                f"{np.abs(sims - reference[1]).max():.5f}",
+                f"{np.mean(sims.argmax(axis=1) == reference[1].argmax(axis=1)):.3f}",
+            )
+
+        print(
+            f"{backend:<10} {load_seconds:>7.2f} {len(sentences) / sent_seconds:>9,.0f} "
+            f"{len(resumes) / resume_seconds:>10,.1f} {drift[0]:>9} {drift[1]:>9} {drift[2]:>9} {drift[3]:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# benchmarks/bench_startup.py
+#
+# Import-time benchmark for the utils.* modules.
+# Each import runs in a fresh interpreter; the median of several runs is reported.
+#
+# Usage (from the project root):
+#   python benchmarks/bench_startup.py                    # current tree
+#   python benchmarks/bench_startup.py --baseline HEAD~1  # also time an older commit
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import io
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+MODULES = [
+    "utils.text_cleaner",
+    "utils.parser",
+    "utils.skills",
+    "utils.scoring",
+    "utils.embedding",
+    "utils.model_loader",
+    "utils.report",
+]
+
+_SNIPPET = (
+    "import sys, time; sys.path.insert(0, {root!r}); "
+    "t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def time_import(root, module, runs=5, timeout=120):
+    """Median import time in seconds, or None if the import fails / hangs."""
+    samples = []
+    for _ in range(runs):
+        try:
+            out = subprocess.run(
+                [sys.executable, "-c", _SNIPPET.format(root=root, module=module)],
+                capture_output=True, text=True, timeout=timeout, cwd=root,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        if out.returncode != 0:
+            return None
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def export_ref(ref, dest):
+    """Extract a git revision of the project into `dest`."""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", ref],
+        capture_output=True, check=True, cwd=PROJECT_ROOT,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(dest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time utils.* imports in fresh interpreters.")
+    parser.add_argument("--baseline", help="git revision to compare against (e.g. HEAD~1)")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    trees = [("current", PROJECT_ROOT)]
+    tmp = None
+    if args.baseline:
+        tmp = tempfile.TemporaryDirectory()
+        export_ref(args.baseline, tmp.name)
+        trees.insert(0, (args.baseline, tmp.name))
+
+    header = f"{'module':<22}" + "".join(f"{name:>14}" for name, _ in trees)
+    print(header)
+    print("-" * len(header))
+    for module in MODULES:
+        cells = []
+        for _, root in trees:
+            t = time_import(root, module, runs=args.runs)
+            cells.append(f"{t * 1000:>12.1f}ms" if t is not None else f"{'failed':>14}")
+        print(f"{module:<22}" + "".join(cells))
+
+    if tmp is not None:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
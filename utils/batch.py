@@ -0,0 +1,242 @@
+# utils/batch.py
+#
+# Headless batch screening: rank many resumes against one job description.
+#
+# Usage (from the project root):
+#   python -m utils.batch --jd job_description.txt resumes/ -o ranked.csv
+
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from sklearn.metrics.pairwise import cosine_similarity
+
+from utils.parser import extract_text_from_bytes
+from utils.features import extract_resume_features
+from utils.job_profile import JobProfile
+from utils.embedding import encode_texts, cosine_scores, chunked_similarities, POOLING_MODES
+from utils.scoring import score_experience, score_education, final_ats_scores
+from utils.model_registry import get_tfidf, get_hybrid_predictor
+from utils.parse_pool import ParsePool
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+RESULT_COLUMNS = [
+    "rank",
+    "file",
+    "final_score",
+    "skill_match_percent",
+    "bert_score",
+    "tfidf_sim",
+    "exp_score",
+    "edu_score",
+    "experience_years",
+    "education_level",
+    "predicted_category",
+    "model_confidence",
+    "category_probability",
+    "email",
+    "phone",
+    "resume_skills",
+    "missing_skills",
+    "error",
+]
+
+
+# ----------------------------------------------------------
+# Input handling
+# ----------------------------------------------------------
+def _iter_documents(resumes):
+    """
+    Yield (name, file_bytes) pairs from:
+    - a directory path (all PDF/DOCX files inside it, sorted)
+    - an iterable of file paths, (name, bytes) tuples or file-like
+      objects with .name and .read() (e.g. Streamlit uploads)
+    """
+    if isinstance(resumes, (str, os.PathLike)):
+        folder = os.fspath(resumes)
+        resumes = [
+            os.path.join(folder, f)
+            for f in sorted(os.listdir(folder))
+            if f.lower().endswith(SUPPORTED_EXTENSIONS)
+        ]
+
+    for item in resumes:
+        if isinstance(item, (str, os.PathLike)):
+            path = os.fspath(item)
+            with open(path, "rb") as fh:
+                yield os.path.basename(path), fh.read()
+        elif isinstance(item, tuple):
+            name, file_bytes = item
+            yield name, file_bytes
+        else:
+            yield item.name, item.read()
+
+
+def _iter_texts(resumes, workers=None, max_pages=None, max_chars=None):
+    """Yield (name, text, error); parses in a process pool when workers > 1."""
+    if workers and workers > 1:
+        docs = ((name, name, file_bytes) for name, file_bytes in _iter_documents(resumes))
+        with ParsePool(max_workers=workers, max_pages=max_pages, max_chars=max_chars) as pool:
+            for res in pool.parse(docs):
+                yield res.doc_id, res.text, res.error
+        return
+
+    for name, file_bytes in _iter_documents(resumes):
+        try:
+            text = extract_text_from_bytes(file_bytes, name, max_pages=max_pages, max_chars=max_chars)
+            yield name, text, None
+        except Exception as exc:
+            yield name, "", str(exc)
+
+
+# ----------------------------------------------------------
+# Batch pipeline
+# ----------------------------------------------------------
+def screen_resumes(resumes, job_description: str, batch_size: int = 32,
+                   workers: int = None, max_pages: int = None, max_chars: int = None,
+                   weights: dict = None, chunked: bool = False, pooling: str = None) -> pd.DataFrame:
+    """
+    Run the full ATS pipeline for many resumes against one job description.
+
+    `job_description` is the JD text or a prebuilt JobProfile; either way
+    the JD is featurized once, resume embeddings and TF-IDF vectors are
+    computed in batches. With `workers` > 1 documents are parsed in a
+    process pool; `max_pages` / `max_chars` cap how much of each PDF is
+    read. `weights` overrides entries of scoring.ATS_WEIGHTS.
+    With `chunked`, the BERT score pools section-level similarities
+    ("max" / "mean" / "topk", see utils.embedding) so long resumes are
+    not truncated; the classifier still uses the whole-resume embedding.
+    Returns a DataFrame ranked by final ATS score.
+    Files that fail to parse are kept at the bottom with an error message.
+    """
+    tfidf = get_tfidf()
+    predictor = get_hybrid_predictor()
+
+    # --- JD features (computed once) ---
+    profile = job_description if isinstance(job_description, JobProfile) else JobProfile(job_description)
+
+    # --- Per-resume rule-based features ---
+    rows = []
+    texts = []
+    cleaned = []
+    for name, text, error in _iter_texts(resumes, workers=workers, max_pages=max_pages, max_chars=max_chars):
+        row = {"file": name, "error": error}
+        if error:
+            rows.append(row)
+            continue
+
+        features = extract_resume_features(text)
+        resume_skills = features.skills
+        experience_years = features.experience_years
+        education_level = features.education_level
+
+        row.update(
+            skill_match_percent=round(profile.skill_match(resume_skills) * 100, 2),
+            exp_score=score_experience(experience_years, profile),
+            edu_score=score_education(education_level, profile),
+            experience_years=experience_years,
+            education_level=education_level,
+            email=features.email,
+            phone=features.phone,
+            resume_skills=", ".join(resume_skills),
+            missing_skills=", ".join(profile.missing_skills(resume_skills)),
+        )
+        row["_text_idx"] = len(texts)
+        texts.append(text)
+        cleaned.append(features.cleaned_text)
+        rows.append(row)
+
+    # --- Batched vector features ---
+    if texts:
+        resume_emb = encode_texts(texts, batch_size=batch_size)
+        tfidf_mat = tfidf.transform(cleaned)
+
+        if chunked:
+            bert_sims = chunked_similarities(texts, profile.embedding, pooling=pooling, batch_size=batch_size)
+        else:
+            bert_sims = cosine_scores(resume_emb, profile.embedding)
+        tfidf_sims = cosine_similarity(tfidf_mat, profile.tfidf_vector).ravel()
+
+        preds, confidences, probs = predictor.predict_all(resume_emb, tfidf_mat)
+        # Only calibrated probabilities are reported (NaN otherwise)
+        probabilities = probs.max(axis=1) if predictor.is_calibrated else np.full(len(texts), np.nan)
+
+        # --- Final scores for every parsed resume in one vectorized pass ---
+        scored = [row for row in rows if "_text_idx" in row]
+        final_scores = final_ats_scores(
+            np.array([row["skill_match_percent"] for row in scored]) / 100,
+            bert_sims,
+            tfidf_sims,
+            np.array([row["exp_score"] for row in scored]),
+            np.array([row["edu_score"] for row in scored]),
+            weights=weights,
+        )
+
+    for row in rows:
+        i = row.pop("_text_idx", None)
+        if i is None:
+            continue
+        row["bert_score"] = float(bert_sims[i])
+        row["tfidf_sim"] = float(tfidf_sims[i])
+        row["predicted_category"] = preds[i]
+        row["model_confidence"] = float(confidences[i])
+        row["category_probability"] = float(probabilities[i])
+        row["final_score"] = float(final_scores[i])
+
+    df = pd.DataFrame(rows, columns=[c for c in RESULT_COLUMNS if c != "rank"])
+    df = df.sort_values("final_score", ascending=False, na_position="last", kind="stable")
+    df.insert(0, "rank", range(1, len(df) + 1))
+    return df.reset_index(drop=True)
+
+
+def write_results(df: pd.DataFrame, path: str):
+    """Write ranked results as CSV, Parquet or JSON based on the file extension."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        df.to_csv(path, index=False)
+    elif ext == ".parquet":
+        df.to_parquet(path, index=False)  # requires pyarrow or fastparquet
+    elif ext == ".json":
+        df.to_json(path, orient="records", indent=2)
+    else:
+        raise ValueError("Unsupported output format. Use .csv, .parquet or .json.")
+
+
+# ----------------------------------------------------------
+# CLI
+# ----------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Rank a folder of PDF/DOCX resumes against one job description."
+    )
+    parser.add_argument("resumes", nargs="+", help="Resume folder or resume files")
+    parser.add_argument("--jd", required=True, help="Path to a job description text file")
+    parser.add_argument("-o", "--output", default="ranked_resumes.csv",
+                        help="Output file (.csv, .parquet or .json)")
+    parser.add_argument("--batch-size", type=int, default=32, help="SBERT encode batch size")
+    parser.add_argument("--top", type=int, default=None, help="Only keep the top N candidates")
+    parser.add_argument("--workers", type=int, default=None, help="Parse documents in N processes")
+    parser.add_argument("--max-pages", type=int, default=None, help="Only read the first N PDF pages")
+    parser.add_argument("--max-chars", type=int, default=None, help="Only read the first N PDF characters")
+    parser.add_argument("--chunked", action="store_true", help="Score long resumes section by section")
+    parser.add_argument("--pooling", choices=POOLING_MODES, default=None,
+                        help="How chunk similarities are combined with --chunked (default: topk)")
+    args = parser.parse_args(argv)
+
+    with open(args.jd, "r", encoding="utf-8") as fh:
+        job_description = fh.read()
+
+    resumes = args.resumes[0] if len(args.resumes) == 1 and os.path.isdir(args.resumes[0]) else args.resumes
+    df = screen_resumes(resumes, job_description, batch_size=args.batch_size,
+                        workers=args.workers, max_pages=args.max_pages, max_chars=args.max_chars,
+                        chunked=args.chunked, pooling=args.pooling)
+    if args.top:
+        df = df.head(args.top)
+
+    write_results(df, args.output)
+    print(f"Ranked {len(df)} resumes -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
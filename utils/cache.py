@@ -0,0 +1,204 @@
+# utils/cache.py
+#
+# Small caching building blocks shared by the pipeline:
+# - LRUCache:       bounded, thread-safe in-memory tier with hit/miss counters
+# - SQLiteStore:    optional on-disk key -> blob tier (memory-mapped reads)
+# - EmbeddingCache: content-addressed SBERT embedding cache built on both
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_text(text) -> str:
+    """Collapse whitespace so trivially different copies share a cache key."""
+    if text is None:
+        return ""
+    return _WS_RE.sub(" ", str(text)).strip()
+
+
+def text_key(text, namespace: str = "") -> str:
+    """SHA-256 of namespace + normalized text."""
+    h = hashlib.sha256()
+    h.update(namespace.encode("utf-8"))
+    h.update(b"\0")
+    h.update(normalize_text(text).encode("utf-8"))
+    return h.hexdigest()
+
+
+# ------------ In-memory tier ------------ #
+
+class LRUCache:
+    """Bounded least-recently-used mapping. Safe to share between threads."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+# ------------ On-disk tier ------------ #
+
+class SQLiteStore:
+    """
+    Persistent key -> bytes store backed by one SQLite file.
+    Reads go through SQLite's memory-mapped I/O.
+    """
+
+    def __init__(self, path: str, table: str = "cache", mmap_size: int = 256 * 1024 * 1024):
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key, value: bytes):
+        self.put_many([(key, value)])
+
+    def put_many(self, items):
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+                [(k, sqlite3.Binary(v)) for k, v in items],
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ------------ Embedding cache ------------ #
+
+class EmbeddingCache:
+    """
+    Content-addressed cache of float32 embeddings.
+
+    Keys are SHA-256(model identity + normalized text), so a different
+    model never serves stale vectors. Lookups try the in-memory LRU first,
+    then the optional SQLite file (promoting disk hits into memory).
+    """
+
+    def __init__(self, model_id: str, maxsize: int = 4096, disk_path: str = None):
+        self.model_id = model_id
+        self.memory = LRUCache(maxsize)
+        self.disk = SQLiteStore(disk_path, table="embeddings") if disk_path else None
+        self.disk_hits = 0
+
+    def key(self, text) -> str:
+        return text_key(text, namespace=self.model_id)
+
+    def get(self, text):
+        """Return the cached vector for `text`, or None."""
+        key = self.key(text)
+        vec = self.memory.get(key)
+        if vec is not None or self.disk is None:
+            return vec
+
+        blob = self.disk.get(key)
+        if blob is None:
+            return None
+        vec = np.frombuffer(blob, dtype=np.float32)
+        self.memory.put(key, vec)
+        self.disk_hits += 1
+        return vec
+
+    def put_many(self, texts, vectors):
+        """Store one float32 row of `vectors` per text."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        items = []
+        for text, vec in zip(texts, vectors):
+            key = self.key(text)
+            vec = vec.copy()
+            vec.flags.writeable = False
+            self.memory.put(key, vec)
+            items.append((key, vec.tobytes()))
+        if self.disk is not None and items:
+            self.disk.put_many(items)
+
+    def stats(self) -> dict:
+        """Hit/miss counters (a disk hit counts as a memory miss)."""
+        hits = self.memory.hits + self.disk_hits
+        misses = self.memory.misses - self.disk_hits
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "memory_hits": self.memory.hits,
+            "disk_hits": self.disk_hits,
+            "hit_rate": hits / total if total else 0.0,
+            "memory_entries": len(self.memory),
+            "disk_entries": len(self.disk) if self.disk is not None else 0,
+        }
+
+    def clear(self):
+        self.memory.clear()
+        self.disk_hits = 0
+        if self.disk is not None:
+            self.disk.clear()
@@ -0,0 +1,177 @@
+# utils/calibration.py
+#
+# Probability calibration for the hybrid classifier.
+#
+# LinearSVC only gives decision margins. Temperature scaling turns them into
+# probabilities with one fitted parameter:
+#   p = softmax(decision_function / T)
+# T is fit offline on labelled resumes (minimum negative log-likelihood) and
+# stored next to the model, so inference is one division + softmax.
+#
+# Fit (use resumes the model was NOT trained on, e.g. the held-out split):
+#   python -m utils.calibration --data data/Resume.csv \
+#       --text-column Resume_str --label-column Category
+#
+# Writes models/resume_hybrid_calibration.json:
+#   {"method": "temperature", "temperature": T, "classes": [...], ...}
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from utils.model_registry import MODELS_DIR
+
+CALIBRATION_PATH = os.path.join(MODELS_DIR, "resume_hybrid_calibration.json")
+
+# Search range for T (log-spaced), wide enough for any sane margin scale
+_MIN_TEMPERATURE = 1e-3
+_MAX_TEMPERATURE = 1e3
+
+
+# ------------------------------------------
+# Math
+# ------------------------------------------
+def softmax(scores, temperature: float = 1.0):
+    """Row-wise softmax of (n, classes) scores / temperature."""
+    z = np.asarray(scores, dtype=np.float64) / temperature
+    z -= z.max(axis=1, keepdims=True)
+    np.exp(z, out=z)
+    z /= z.sum(axis=1, keepdims=True)
+    return z
+
+
+def negative_log_likelihood(scores, label_idx, temperature: float) -> float:
+    """Mean NLL of the true classes under softmax(scores / T)."""
+    z = np.asarray(scores, dtype=np.float64) / temperature
+    z -= z.max(axis=1, keepdims=True)
+    log_norm = np.log(np.exp(z).sum(axis=1))
+    return float(np.mean(log_norm - z[np.arange(len(z)), label_idx]))
+
+
+def expected_calibration_error(probs, label_idx, n_bins: int = 15) -> float:
+    """ECE of the top-1 probability over equal-width confidence bins."""
+    confidence = probs.max(axis=1)
+    correct = probs.argmax(axis=1) == label_idx
+    bins = np.minimum((confidence * n_bins).astype(int), n_bins - 1)
+    ece = 0.0
+    for b in range(n_bins):
+        mask = bins == b
+        if mask.any():
+            ece += mask.mean() * abs(correct[mask].mean() - confidence[mask].mean())
+    return float(ece)
+
+
+def fit_temperature(scores, label_idx) -> float:
+    """Temperature minimizing NLL on (decision scores, true class indices)."""
+    from scipy.optimize import minimize_scalar
+
+    scores = np.asarray(scores, dtype=np.float64)
+    label_idx = np.asarray(label_idx)
+    result = minimize_scalar(
+        lambda log_t: negative_log_likelihood(scores, label_idx, np.exp(log_t)),
+        bounds=(np.log(_MIN_TEMPERATURE), np.log(_MAX_TEMPERATURE)),
+        method="bounded",
+    )
+    return float(np.exp(result.x))
+
+
+# ------------------------------------------
+# Artifact
+# ------------------------------------------
+def load_calibration(path: str = CALIBRATION_PATH, classes=None):
+    """
+    The stored calibration dict, or None if there is no file or it was fit
+    for a different set of classes (i.e. an older/newer model).
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            calibration = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if classes is not None and list(calibration.get("classes", [])) != [str(c) for c in classes]:
+        return None
+    return calibration
+
+
+def save_calibration(calibration: dict, path: str = CALIBRATION_PATH):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(calibration, fh, indent=2)
+    os.replace(tmp, path)
+
+
+# ------------------------------------------
+# Offline fitting
+# ------------------------------------------
+def calibrate(texts, labels, batch_size: int = 32) -> dict:
+    """Fit the temperature on labelled resume texts; returns the calibration dict."""
+    from utils.embedding import encode_texts
+    from utils.model_registry import get_tfidf, get_hybrid_predictor
+    from utils.text_cleaner import clean_many
+
+    predictor = get_hybrid_predictor()
+    classes = [str(c) for c in predictor.classes_]
+    class_idx = {c.lower(): i for i, c in enumerate(classes)}
+
+    # Labels the model doesn't know (merged / dropped categories) are skipped
+    keep = [i for i, label in enumerate(labels) if str(label).strip().lower() in class_idx]
+    if not keep:
+        raise ValueError("None of the labels match the model's classes")
+    texts = [texts[i] for i in keep]
+    label_idx = np.array([class_idx[str(labels[i]).strip().lower()] for i in keep])
+
+    scores = predictor.decision_function(
+        encode_texts(texts, batch_size=batch_size),
+        get_tfidf().transform(clean_many(texts)),
+    )
+    temperature = fit_temperature(scores, label_idx)
+
+    return {
+        "method": "temperature",
+        "temperature": temperature,
+        "classes": classes,
+        "n_samples": len(texts),
+        "accuracy": float(np.mean(scores.argmax(axis=1) == label_idx)),
+        "nll_uncalibrated": negative_log_likelihood(scores, label_idx, 1.0),
+        "nll_calibrated": negative_log_likelihood(scores, label_idx, temperature),
+        "ece_uncalibrated": expected_calibration_error(softmax(scores), label_idx),
+        "ece_calibrated": expected_calibration_error(softmax(scores, temperature), label_idx),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Fit temperature scaling for the hybrid classifier on labelled resumes."
+    )
+    parser.add_argument("--data", required=True, help="CSV with resume text and category columns")
+    parser.add_argument("--text-column", default="Resume_str")
+    parser.add_argument("--label-column", default="Category")
+    parser.add_argument("--sample", type=int, help="fit on a random sample of this many rows")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("-o", "--output", default=CALIBRATION_PATH)
+    args = parser.parse_args(argv)
+
+    import pandas as pd
+
+    df = pd.read_csv(args.data, usecols=[args.text_column, args.label_column]).dropna()
+    if args.sample and args.sample < len(df):
+        df = df.sample(n=args.sample, random_state=42)
+
+    calibration = calibrate(
+        df[args.text_column].astype(str).tolist(),
+        df[args.label_column].tolist(),
+        batch_size=args.batch_size,
+    )
+    save_calibration(calibration, args.output)
+
+    print(f"Fitted on {calibration['n_samples']} resumes (accuracy {calibration['accuracy']:.3f})")
+    print(f"Temperature: {calibration['temperature']:.4f}")
+    print(f"NLL: {calibration['nll_uncalibrated']:.4f} -> {calibration['nll_calibrated']:.4f}")
+    print(f"ECE: {calibration['ece_uncalibrated']:.4f} -> {calibration['ece_calibrated']:.4f}")
+    print(f"Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
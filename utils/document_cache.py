@@ -0,0 +1,119 @@
+# utils/document_cache.py
+#
+# Cache of parsed resumes keyed by the SHA-256 of the uploaded file bytes,
+# namespaced by FEATURES_VERSION and the skill taxonomy hash so editing the
+# taxonomy or the extraction code never serves stale features.
+# Identical uploads (Streamlit reruns, the same CV sent to many requisitions)
+# skip PDF/DOCX parsing and feature extraction entirely.
+#
+# Each record holds the extracted text plus derived features:
+#   {"sha256", "text", "skills", "experience_years", "education_level", "contact"}
+#
+# Memory tier size and optional on-disk SQLite file, set via env vars:
+#   RESUME_DOCUMENT_CACHE_SIZE=256
+#   RESUME_DOCUMENT_CACHE_PATH=/path/to/documents.sqlite
+
+import copy
+import hashlib
+import json
+import os
+
+from utils.cache import LRUCache, SQLiteStore
+from utils.features import FEATURES_VERSION, extract_resume_features
+from utils.parser import extract_text_from_bytes
+from utils.skills import taxonomy_hash
+
+KEY_NAMESPACE = f"features-v{FEATURES_VERSION}:{taxonomy_hash()[:16]}"
+
+
+class DocumentCache:
+
+    def __init__(self, maxsize: int = 256, disk_path: str = None):
+        self.memory = LRUCache(maxsize)
+        self.disk = SQLiteStore(disk_path, table="documents") if disk_path else None
+        self.disk_hits = 0
+
+    def get(self, key: str):
+        record = self.memory.get(key)
+        if record is not None or self.disk is None:
+            return record
+
+        blob = self.disk.get(key)
+        if blob is None:
+            return None
+        record = json.loads(bytes(blob).decode("utf-8"))
+        self.memory.put(key, record)
+        self.disk_hits += 1
+        return record
+
+    def put(self, key: str, record: dict):
+        self.memory.put(key, record)
+        if self.disk is not None:
+            self.disk.put(key, json.dumps(record).encode("utf-8"))
+
+    def stats(self) -> dict:
+        hits = self.memory.hits + self.disk_hits
+        misses = self.memory.misses - self.disk_hits
+        return {
+            "hits": hits,
+            "misses": misses,
+            "memory_hits": self.memory.hits,
+            "disk_hits": self.disk_hits,
+            "memory_entries": len(self.memory),
+            "disk_entries": len(self.disk) if self.disk is not None else 0,
+        }
+
+    def clear(self):
+        self.memory.clear()
+        self.disk_hits = 0
+        if self.disk is not None:
+            self.disk.clear()
+
+
+document_cache = DocumentCache(
+    maxsize=int(os.environ.get("RESUME_DOCUMENT_CACHE_SIZE", "256")),
+    disk_path=os.environ.get("RESUME_DOCUMENT_CACHE_PATH") or None,
+)
+
+
+def extract_document_features(text: str) -> dict:
+    """Text -> record with skills, experience, education and contact details."""
+    features = extract_resume_features(text, with_cleaned_text=False)
+    return {
+        "text": text,
+        "skills": features.skills,
+        "experience_years": features.experience_years,
+        "education_level": features.education_level,
+        "contact": features.contact,
+    }
+
+
+def _cached(digest: str, build):
+    key = f"{KEY_NAMESPACE}:{digest}"
+    record = document_cache.get(key)
+    if record is None:
+        record = {"sha256": digest, **build()}
+        document_cache.put(key, record)
+    # Callers may mutate what they get (skills list, contact dict)
+    return copy.deepcopy(record)
+
+
+def parse_document(file_bytes: bytes, filename: str) -> dict:
+    """Parse a PDF/DOCX (or reuse the cached result for identical bytes)."""
+    digest = hashlib.sha256(file_bytes).hexdigest()
+    return _cached(digest, lambda: extract_document_features(extract_text_from_bytes(file_bytes, filename)))
+
+
+def parse_text(text: str) -> dict:
+    """Same record for pasted resume text, keyed by the text's SHA-256."""
+    digest = "text:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return _cached(digest, lambda: extract_document_features(text))
+
+
+def parse_upload(uploaded_file) -> dict:
+    """Streamlit uploaded_file -> cached record."""
+    if hasattr(uploaded_file, "getvalue"):
+        file_bytes = uploaded_file.getvalue()
+    else:
+        file_bytes = uploaded_file.read()
+    return parse_document(file_bytes, uploaded_file.name)
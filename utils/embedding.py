@@ -1,32 +1,238 @@
 # utils/embedding.py
 
 import os
-from sentence_transformers import SentenceTransformer
-from sentence_transformers.util import cos_sim
+import re
+import numpy as np
+
+from utils.cache import EmbeddingCache, LRUCache, text_key
+from utils.model_registry import sbert_source, get_bert_model
+from utils.sbert_backends import SBERT_BACKEND
 
 # ------------------------------------------
-# Load LOCAL SBERT MODEL from /models/
+# LOCAL SBERT MODEL from /models/
 # ------------------------------------------
+# The model itself is loaded lazily by utils.model_registry on first
+# encode (NO HF DOWNLOAD, nothing loaded at import time).
+MODEL_PATH = sbert_source()
+
+
+def __getattr__(name):
+    # Backwards compatible `from utils.embedding import bert_model`
+    if name == "bert_model":
+        return get_bert_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+DEFAULT_BATCH_SIZE = 32
+
+# ------------------------------------------
+# Embedding cache
+# ------------------------------------------
+# In-memory LRU size and optional on-disk SQLite file, set via env vars:
+#   RESUME_EMBEDDING_CACHE_SIZE=4096
+#   RESUME_EMBEDDING_CACHE_PATH=/path/to/embeddings.sqlite
+# Quantized / ONNX backends produce slightly different vectors, so each
+# backend gets its own cache namespace.
+embedding_cache = EmbeddingCache(
+    model_id=os.path.basename(os.path.normpath(MODEL_PATH)) + ("" if SBERT_BACKEND == "torch" else f"@{SBERT_BACKEND}"),
+    maxsize=int(os.environ.get("RESUME_EMBEDDING_CACHE_SIZE", "4096")),
+    disk_path=os.environ.get("RESUME_EMBEDDING_CACHE_PATH") or None,
+)
+
+
+def _encode_uncached(texts, batch_size):
+    """Encode texts sorted by length, returned in input order."""
+    order = np.argsort([-len(t) for t in texts], kind="stable")
+    encoded = get_bert_model().encode(
+        [texts[i] for i in order],
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    out = np.empty((len(texts), encoded.shape[1]), dtype=np.float32)
+    out[order] = encoded
+    return out
 
-# Path: utils/ → go to project root
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-ROOT_DIR = os.path.dirname(BASE_DIR)
 
-# Full local SBERT model path
-MODEL_PATH = os.path.join(ROOT_DIR, "models", "all-MiniLM-L6-v2")
+def encode_texts(texts, batch_size: int = DEFAULT_BATCH_SIZE, use_cache: bool = True) -> np.ndarray:
+    """
+    Encode many texts in one batched pass.
 
-# Load from local folder (NO HF DOWNLOAD)
-bert_model = SentenceTransformer(MODEL_PATH, device="cpu")
+    Texts are sorted by length before batching so each batch pads to a
+    similar sequence length, then restored to input order. Cached texts
+    are served from `embedding_cache`; only the misses hit the model.
+    Returns a C-contiguous float32 matrix of shape (len(texts), dim).
+    """
+    texts = ["" if t is None else str(t) for t in texts]
+    if not texts:
+        dim = get_bert_model().get_sentence_embedding_dimension()
+        return np.zeros((0, dim), dtype=np.float32)
+
+    if not use_cache:
+        return _encode_uncached(texts, batch_size)
+
+    # Full cache hits never touch (or even load) the model
+    rows = [None] * len(texts)
+    missing = {}  # text -> output rows needing it
+    for i, text in enumerate(texts):
+        vec = embedding_cache.get(text)
+        if vec is None:
+            missing.setdefault(text, []).append(i)
+        else:
+            rows[i] = vec
+
+    if missing:
+        new_texts = list(missing)
+        encoded = _encode_uncached(new_texts, batch_size)
+        embedding_cache.put_many(new_texts, encoded)
+        for text, vec in zip(new_texts, encoded):
+            for i in missing[text]:
+                rows[i] = vec
+
+    return np.ascontiguousarray(np.stack(rows), dtype=np.float32)
 
 
 def get_embedding(text):
-    """Return SBERT embedding vector."""
-    return bert_model.encode(text, convert_to_tensor=True)
+    """Return SBERT embedding vector (float32, 1-D)."""
+    return encode_texts([text])[0]
+
+
+def cosine_scores(matrix, vector) -> np.ndarray:
+    """Cosine similarity of every row in `matrix` against one `vector`."""
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector)
+    return (matrix @ vector) / np.maximum(norms, 1e-12)
+
+
+def bert_similarity_from_embeddings(emb1, emb2) -> float:
+    """Cosine similarity between two precomputed embeddings."""
+    return float(cosine_scores(emb1, emb2)[0])
+
+
+def compute_bert_similarity(text1, text2, chunked: bool = False, pooling: str = None):
+    """
+    Compute semantic similarity between texts.
+    With chunked=True, `text1` (the resume) is scored section by section
+    and pooled (see chunked_similarities) instead of being truncated.
+    """
+    if chunked:
+        jd_emb = encode_texts([text2])[0]
+        return float(chunked_similarities([text1], jd_emb, pooling=pooling)[0])
+    emb = encode_texts([text1, text2])
+    return bert_similarity_from_embeddings(emb[0], emb[1])
+
+
+# ------------------------------------------
+# Chunked embeddings for long resumes
+# ------------------------------------------
+# MiniLM truncates at 256 word pieces, so one vector only "sees" the top of
+# a multi-page resume. In chunked mode the resume is split into windows of
+# whole lines / sentences (at most CHUNK_MAX_WORDS words, comfortably under
+# the token limit), every chunk is encoded in one batched call, and the
+# resume-vs-JD similarity is pooled over chunks:
+#   "max"   best-matching section
+#   "mean"  average over all sections
+#   "topk"  mean of the CHUNK_TOP_K best sections (default)
+# Chunk vectors go through `embedding_cache`, and each resume's chunk
+# matrix is kept in `chunk_cache`, so scoring the same resumes against a
+# new JD only encodes the JD.
+CHUNK_MAX_WORDS = 128
+CHUNK_TOP_K = 3
+CHUNK_POOLING = os.environ.get("RESUME_CHUNK_POOLING", "topk")
+POOLING_MODES = ("max", "mean", "topk")
+
+chunk_cache = LRUCache(int(os.environ.get("RESUME_CHUNK_CACHE_SIZE", "1024")))
+
+# Line breaks and sentence ends
+_PIECE_RE = re.compile(r"\n+|(?<=[.!?;])\s+")
+
+
+def split_chunks(text: str, max_words: int = CHUNK_MAX_WORDS):
+    """Pack consecutive lines / sentences of `text` into windows of <= max_words words."""
+    chunks = []
+    current, count = [], 0
+    for piece in _PIECE_RE.split(text or ""):
+        words = piece.split()
+        if not words:
+            continue
+        # An over-long single piece is cut into max_words slices
+        while len(words) > max_words:
+            if current:
+                chunks.append(" ".join(current))
+                current, count = [], 0
+            chunks.append(" ".join(words[:max_words]))
+            words = words[max_words:]
+        if count + len(words) > max_words and current:
+            chunks.append(" ".join(current))
+            current, count = [], 0
+        current.extend(words)
+        count += len(words)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks or [""]
+
+
+def encode_chunks(texts, batch_size: int = DEFAULT_BATCH_SIZE, max_words: int = CHUNK_MAX_WORDS):
+    """
+    List of (n_chunks_i, dim) float32 matrices, one per text.
+    All uncached chunks of all texts are encoded in a single encode_texts call.
+    """
+    texts = ["" if t is None else str(t) for t in texts]
+    namespace = f"chunks:{max_words}"
+    keys = [text_key(t, namespace) for t in texts]
+    out = [chunk_cache.get(k) for k in keys]
+
+    pending = {}  # key -> (chunks, output rows)
+    for i, (key, mat) in enumerate(zip(keys, out)):
+        if mat is None:
+            if key not in pending:
+                pending[key] = (split_chunks(texts[i], max_words), [])
+            pending[key][1].append(i)
+
+    if pending:
+        all_chunks = [c for chunks, _ in pending.values() for c in chunks]
+        encoded = encode_texts(all_chunks, batch_size=batch_size)
+        start = 0
+        for key, (chunks, rows) in pending.items():
+            # A copy, not a view: a cached view would keep all of `encoded` alive
+            mat = encoded[start:start + len(chunks)].copy()
+            start += len(chunks)
+            chunk_cache.put(key, mat)
+            for i in rows:
+                out[i] = mat
+    return out
+
+
+def pool_similarities(chunk_matrices, vector, pooling: str = None, top_k: int = CHUNK_TOP_K) -> np.ndarray:
+    """
+    Pooled cosine similarity of each chunk matrix against `vector`.
+    All chunks are scored with one matrix product, then reduced per resume.
+    """
+    pooling = pooling or CHUNK_POOLING
+    if pooling not in POOLING_MODES:
+        raise ValueError(f"Unknown pooling '{pooling}'. Choose one of: {', '.join(POOLING_MODES)}")
+    if not chunk_matrices:
+        return np.zeros(0, dtype=np.float32)
+
+    counts = np.array([len(m) for m in chunk_matrices])
+    sims = cosine_scores(np.concatenate(chunk_matrices), vector)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    if pooling == "max":
+        return np.maximum.reduceat(sims, starts)
+    if pooling == "mean":
+        return np.add.reduceat(sims, starts) / counts
+
+    # topk: pad into (n, max_chunks) with -inf, keep the k best per row
+    k = min(top_k, counts.max())
+    padded = np.full((len(counts), counts.max()), -np.inf, dtype=sims.dtype)
+    padded[np.repeat(np.arange(len(counts)), counts), np.arange(len(sims)) - np.repeat(starts, counts)] = sims
+    best = -np.partition(-padded, k - 1, axis=1)[:, :k]
+    best[np.isinf(best)] = 0  # rows with fewer than k chunks
+    return best.sum(axis=1) / np.minimum(counts, k)
 
 
-def compute_bert_similarity(text1, text2):
-    """Compute semantic similarity between texts."""
-    emb1 = get_embedding(text1)
-    emb2 = get_embedding(text2)
-    score = cos_sim(emb1, emb2)[0][0]
-    return float(score)
\ No newline at end of file
+def chunked_similarities(texts, vector, pooling: str = None, top_k: int = CHUNK_TOP_K,
+                         batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+    """Chunk-pooled SBERT similarity of every text in `texts` against one embedding."""
+    return pool_similarities(encode_chunks(texts, batch_size=batch_size), vector, pooling=pooling, top_k=top_k)
@@ -0,0 +1,126 @@
+# utils/features.py
+#
+# All rule-based resume features in one call.
+#
+# Equivalent to calling extract_contact_details, extract_experience_years,
+# extract_education_level, extract_skills and clean_text separately, but the
+# text is lowercased once, tokenized once for both the skill matcher and
+# clean_text, and email / phone / years / education are each one scan with
+# a precompiled pattern.
+
+import re
+
+from utils.skill_matcher import tokenize
+from utils.skills import get_skill_matcher
+from utils.text_cleaner import clean_text, clean_words
+
+# Bump whenever the extracted features change (patterns, fields, rules) so
+# cached feature records (utils/document_cache.py) are recomputed
+FEATURES_VERSION = 1
+
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_PHONE_RE = re.compile(r"\+?\d[\d \-()]{8,}\d")
+
+# "5 years", "5+ years", "2 yrs" (both original patterns in one regex)
+_YEARS_RE = re.compile(r"(\d+)(?:\+?\s*years?|\s*yrs?)")
+
+# Degree keywords, highest level first (same substrings as extract_education_level)
+EDUCATION_LEVELS = [
+    ("PhD", ("phd", "doctorate")),
+    ("Master's", ("master", "m.sc", "m.s", "mba", "m.tech")),
+    ("Bachelor's", ("bachelor", "b.sc", "b.s", "b.tech")),
+    ("Associate Degree", ("associate",)),
+]
+_EDU_RANK = {kw: rank for rank, (_, kws) in enumerate(EDUCATION_LEVELS) for kw in kws}
+_EDU_RE = re.compile("|".join(re.escape(kw) for _, kws in EDUCATION_LEVELS for kw in kws))
+
+_LETTERS_RE = re.compile(r"[a-z]+")
+
+
+class ResumeFeatures:
+    __slots__ = (
+        "email",
+        "phone",
+        "experience_years",
+        "education_level",
+        "skills",
+        "skill_counts",
+        "cleaned_text",
+    )
+
+    def __init__(self, email, phone, experience_years, education_level, skills, skill_counts, cleaned_text):
+        self.email = email
+        self.phone = phone
+        self.experience_years = experience_years
+        self.education_level = education_level
+        self.skills = skills
+        self.skill_counts = skill_counts
+        self.cleaned_text = cleaned_text
+
+    @property
+    def contact(self):
+        """Same shape as extract_contact_details()."""
+        return {"email": self.email, "phone": self.phone}
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (
+            f"ResumeFeatures(experience_years={self.experience_years}, "
+            f"education_level={self.education_level!r}, skills={self.skills!r})"
+        )
+
+
+def _education_level(low: str) -> str:
+    best = len(EDUCATION_LEVELS)
+    for m in _EDU_RE.finditer(low):
+        rank = _EDU_RANK[m.group()]
+        if rank < best:
+            best = rank
+            if best == 0:
+                break
+    return EDUCATION_LEVELS[best][0] if best < len(EDUCATION_LEVELS) else "Not Found"
+
+
+def _words(tokens):
+    """clean_text's words ([a-zA-Z]+ runs) from the matcher's tokens."""
+    words = []
+    for _, token in tokens:
+        if token.isalpha():
+            words.append(token)
+        elif not token.isdigit() and token.isalnum():
+            words.extend(_LETTERS_RE.findall(token))
+    return words
+
+
+def extract_resume_features(text: str, with_cleaned_text: bool = True) -> ResumeFeatures:
+    """All rule-based resume features of `text`, tokenizing it once."""
+    text = text or ""
+    low = text.lower()
+
+    email = _EMAIL_RE.search(text)
+    phone = _PHONE_RE.search(text)
+    years = [int(y) for y in _YEARS_RE.findall(low)]
+    tokens = tokenize(low)
+    counts = get_skill_matcher().count_tokens(tokens)
+
+    cleaned = None
+    if with_cleaned_text:
+        # The matcher's tokens give the same words for plain ASCII text; HTML
+        # (tags are stripped first) and non-ASCII case folding take the
+        # regular path
+        if text.isascii() and "<" not in text:
+            cleaned = clean_words(_words(tokens))
+        else:
+            cleaned = clean_text(text)
+
+    return ResumeFeatures(
+        email=email.group() if email else None,
+        phone=phone.group() if phone else None,
+        experience_years=max(years) if years else 0,
+        education_level=_education_level(low),
+        skills=sorted(counts),
+        skill_counts=counts,
+        cleaned_text=cleaned,
+    )
@@ -0,0 +1,144 @@
+# utils/hybrid_predictor.py
+#
+# Sparse-native prediction for the hybrid [BERT | TF-IDF] classifier.
+#
+# The hybrid model was trained on np.hstack((bert, tfidf.toarray())), which
+# materializes an (n x vocab) dense matrix per batch. For a linear model
+# the decision function splits along the feature axis:
+#   X @ W.T + b  ==  bert @ W_bert.T + tfidf @ W_tfidf.T + b
+# so the sparse TF-IDF block is multiplied directly, never densified.
+# Models without coef_ (non-linear) fall back to the dense hstack path.
+#
+# Usage:
+#   predictor = get_hybrid_predictor()
+#   preds, confidences = predictor.predict_with_confidence(bert_matrix, tfidf_matrix)
+#   preds, margins, probs = predictor.predict_all(bert_matrix, tfidf_matrix)  # one pass
+#
+# Probabilities are only calibrated when a calibration file was loaded
+# (predictor.is_calibrated); otherwise they are a plain softmax of the
+# LinearSVC margins and should not be shown as a confidence.
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def _hstack_dense(bert, tfidf):
+    """The original hybrid feature matrix (used only for non-linear models)."""
+    dense = tfidf.toarray() if sp.issparse(tfidf) else tfidf
+    return np.hstack((np.atleast_2d(bert), dense))
+
+
+class HybridPredictor:
+
+    def __init__(self, model, temperature: float = None):
+        """
+        `temperature` comes from the offline calibration (utils/calibration.py);
+        None means no calibration was fit (plain softmax, is_calibrated False).
+        """
+        self.model = model
+        self.classes_ = model.classes_
+        self.is_calibrated = temperature is not None
+        self.temperature = temperature if temperature is not None else 1.0
+        coef = getattr(model, "coef_", None)
+        self.is_linear = (
+            coef is not None
+            and hasattr(model, "intercept_")
+            and not sp.issparse(coef)
+            and np.ndim(coef) == 2
+        )
+        if self.is_linear:
+            self._coef = np.asarray(coef, dtype=np.float64)
+            self._intercept = np.asarray(model.intercept_, dtype=np.float64)
+        self._blocks = {}
+
+    def prepare(self, bert_dim: int):
+        """
+        Build the per-width weight blocks now instead of on the first
+        prediction (e.g. in a parent process before forking workers).
+        """
+        if self.is_linear:
+            self._split(bert_dim)
+
+    def _split(self, bert_dim: int):
+        """(W_bert.T, W_tfidf.T) for a given BERT width, built once."""
+        blocks = self._blocks.get(bert_dim)
+        if blocks is None:
+            blocks = (
+                np.ascontiguousarray(self._coef[:, :bert_dim].T),
+                np.ascontiguousarray(self._coef[:, bert_dim:].T),
+            )
+            self._blocks[bert_dim] = blocks
+        return blocks
+
+    def decision_function(self, bert, tfidf):
+        """
+        Same values as model.decision_function(np.hstack((bert, tfidf.toarray()))).
+        `bert` is (n, d) dense, `tfidf` is (n, vocab) sparse or dense.
+        """
+        bert = np.atleast_2d(np.asarray(bert, dtype=np.float64))
+        if tfidf.ndim == 1:
+            tfidf = tfidf.reshape(1, -1)
+        if bert.shape[0] != tfidf.shape[0]:
+            raise ValueError(f"Row mismatch: {bert.shape[0]} BERT rows vs {tfidf.shape[0]} TF-IDF rows")
+
+        if not self.is_linear:
+            return self.model.decision_function(_hstack_dense(bert, tfidf))
+
+        n_features = bert.shape[1] + tfidf.shape[1]
+        if n_features != self._coef.shape[1]:
+            raise ValueError(
+                f"Hybrid model expects {self._coef.shape[1]} features, got {n_features} "
+                f"({bert.shape[1]} BERT + {tfidf.shape[1]} TF-IDF)"
+            )
+
+        w_bert, w_tfidf = self._split(bert.shape[1])
+        scores = bert @ w_bert
+        if sp.issparse(tfidf):
+            scores += sp.csr_matrix(tfidf, dtype=np.float64) @ w_tfidf
+        else:
+            scores += np.asarray(tfidf, dtype=np.float64) @ w_tfidf
+        scores += self._intercept
+        return scores.ravel() if scores.shape[1] == 1 else scores
+
+    def _labels(self, scores):
+        if scores.ndim == 1:
+            return self.classes_[(scores > 0).astype(int)]
+        return self.classes_[scores.argmax(axis=1)]
+
+    def predict(self, bert, tfidf):
+        """Class label per row."""
+        if not self.is_linear:
+            return self.model.predict(_hstack_dense(bert, tfidf))
+        return self._labels(self.decision_function(bert, tfidf))
+
+    def predict_with_confidence(self, bert, tfidf):
+        """(labels, max decision value per row) from one decision_function call."""
+        scores = self.decision_function(bert, tfidf)
+        if self.is_linear:
+            labels = self._labels(scores)
+        else:
+            labels = self.model.predict(_hstack_dense(bert, tfidf))
+        confidences = scores if scores.ndim == 1 else scores.max(axis=1)
+        return labels, confidences
+
+    def proba_from_scores(self, scores):
+        """(n, classes) softmax(decision / temperature) of precomputed decision values."""
+        from utils.calibration import softmax
+
+        if scores.ndim == 1:  # binary: margins for the positive class
+            scores = np.column_stack((np.zeros_like(scores), scores))
+        return softmax(scores, self.temperature)
+
+    def predict_proba(self, bert, tfidf):
+        """(n, classes) probabilities; calibrated only if `is_calibrated`."""
+        return self.proba_from_scores(self.decision_function(bert, tfidf))
+
+    def predict_all(self, bert, tfidf):
+        """(labels, max decision value, probabilities) from one decision_function call."""
+        scores = self.decision_function(bert, tfidf)
+        if self.is_linear:
+            labels = self._labels(scores)
+        else:
+            labels = self.model.predict(_hstack_dense(bert, tfidf))
+        confidences = scores if scores.ndim == 1 else scores.max(axis=1)
+        return labels, confidences, self.proba_from_scores(scores)
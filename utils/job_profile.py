@@ -0,0 +1,81 @@
+# utils/job_profile.py
+#
+# Everything derived from a job description, computed once per JD and
+# reused for every resume screened against it:
+#   required years, required degree rank, JD skills, cleaned text,
+#   TF-IDF vector and SBERT embedding.
+#
+# Usage:
+#   profile = JobProfile(job_description)
+#   exp_score = score_experience(resume_years, profile)
+#   edu_score = score_education(resume_degree, profile)
+#
+# The vectors are computed on first access, so rule-based scoring alone
+# never loads the TF-IDF vectorizer or SBERT.
+
+from utils.embedding import encode_texts
+from utils.model_registry import get_tfidf
+from utils.scoring import required_experience_years, required_degree_rank
+from utils.skills import extract_skills
+from utils.text_cleaner import clean_text
+
+
+class JobProfile:
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.required_years = required_experience_years(self.text)
+        self.required_degree_rank = required_degree_rank(self.text)
+        self.skills = frozenset(extract_skills(self.text))
+        self._cleaned_text = None
+        self._tfidf_vector = None
+        self._embedding = None
+
+    @property
+    def skill_list(self):
+        """JD skills, sorted (same as extract_skills(jd))."""
+        return sorted(self.skills)
+
+    @property
+    def cleaned_text(self):
+        if self._cleaned_text is None:
+            self._cleaned_text = clean_text(self.text)
+        return self._cleaned_text
+
+    @property
+    def tfidf_vector(self):
+        """1 x vocab sparse TF-IDF row."""
+        if self._tfidf_vector is None:
+            self._tfidf_vector = get_tfidf().transform([self.cleaned_text])
+        return self._tfidf_vector
+
+    @property
+    def embedding(self):
+        """SBERT embedding (float32 vector)."""
+        if self._embedding is None:
+            self._embedding = encode_texts([self.text])[0]
+        return self._embedding
+
+    @property
+    def has_embedding(self) -> bool:
+        return self._embedding is not None
+
+    def set_embedding(self, embedding):
+        """Reuse an embedding computed alongside other texts in one batch."""
+        self._embedding = embedding
+
+    def skill_match(self, resume_skills) -> float:
+        """Fraction (0-1) of the JD skills found in `resume_skills`."""
+        if not self.skills:
+            return 0
+        return len(self.skills.intersection(resume_skills)) / len(self.skills)
+
+    def missing_skills(self, resume_skills):
+        """Sorted JD skills absent from `resume_skills`."""
+        return sorted(self.skills.difference(resume_skills))
+
+    def __repr__(self):
+        return (
+            f"JobProfile(required_years={self.required_years}, "
+            f"required_degree_rank={self.required_degree_rank}, skills={self.skill_list!r})"
+        )
@@ -0,0 +1,121 @@
+# utils/lemmatizer.py
+#
+# Offline drop-in for nltk's WordNetLemmatizer().lemmatize(word) (noun POS).
+#
+# Uses vendored, precompiled WordNet 3.0 tables in utils/data/ instead of the
+# nltk corpus, so it never downloads anything and costs nothing at import:
+#   wordnet_noun_lemmas.txt.gz      single-word noun lemmas ([a-z]+ only)
+#   wordnet_noun_exceptions.txt     irregular form -> resolved lemma
+#
+# Rebuild the tables from a local nltk wordnet install with:
+#   python -m utils.lemmatizer --build
+
+import gzip
+import os
+import re
+import threading
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+LEMMAS_FILE = os.path.join(DATA_DIR, "wordnet_noun_lemmas.txt.gz")
+EXCEPTIONS_FILE = os.path.join(DATA_DIR, "wordnet_noun_exceptions.txt")
+
+# WordNet morphy detachment rules for nouns (same order as nltk)
+NOUN_SUBSTITUTIONS = [
+    ("s", ""),
+    ("ses", "s"),
+    ("ves", "f"),
+    ("xes", "x"),
+    ("zes", "z"),
+    ("ches", "ch"),
+    ("shes", "sh"),
+    ("men", "man"),
+    ("ies", "y"),
+]
+
+_ALPHA_RE = re.compile(r"[a-z]+")
+
+_tables = None
+_tables_lock = threading.Lock()
+
+
+def _load_tables():
+    """Read the vendored tables once, on first use."""
+    global _tables
+    if _tables is None:
+        with _tables_lock:
+            if _tables is None:
+                with gzip.open(LEMMAS_FILE, "rt", encoding="utf-8") as fh:
+                    lemmas = frozenset(fh.read().split())
+                exceptions = {}
+                with open(EXCEPTIONS_FILE, "r", encoding="utf-8") as fh:
+                    for line in fh:
+                        form, lemma = line.split()
+                        exceptions[form] = lemma
+                _tables = (lemmas, exceptions)
+    return _tables
+
+
+def _apply_rules(forms):
+    return [
+        form[: -len(old)] + new
+        for form in forms
+        for old, new in NOUN_SUBSTITUTIONS
+        if form.endswith(old)
+    ]
+
+
+def lemmatize(word: str) -> str:
+    """
+    Noun lemma of a lowercase alphabetic token, identical to
+    WordNetLemmatizer().lemmatize(word). Unknown words are returned as-is.
+    """
+    lemmas, exceptions = _load_tables()
+
+    # 0. Irregular forms (already resolved when the table was built)
+    if word in exceptions:
+        return exceptions[word]
+
+    # 1-2. Apply the rules once, keep what is in WordNet (original included)
+    forms = _apply_rules([word])
+    found = [f for f in [word] + forms if f in lemmas]
+
+    # 3. Otherwise keep applying rules until something matches
+    while not found and forms:
+        forms = _apply_rules(forms)
+        found = [f for f in forms if f in lemmas]
+
+    return min(found, key=len) if found else word
+
+
+# ------------ Table builder (needs nltk + wordnet corpus) ------------ #
+
+def build_tables(data_dir: str = DATA_DIR):
+    """Regenerate the vendored tables from a local nltk wordnet corpus."""
+    from nltk.corpus import wordnet as wn
+    from nltk.stem import WordNetLemmatizer
+
+    lem = WordNetLemmatizer()
+    lemma_map = wn._lemma_pos_offset_map
+
+    nouns = sorted(w for w, pos in lemma_map.items() if "n" in pos and _ALPHA_RE.fullmatch(w))
+    # mtime=0 keeps the archive byte-identical across rebuilds
+    with gzip.GzipFile(os.path.join(data_dir, os.path.basename(LEMMAS_FILE)), "wb", mtime=0) as fh:
+        fh.write(("\n".join(nouns) + "\n").encode("utf-8"))
+
+    forms = sorted(f for f in wn._exception_map["n"] if _ALPHA_RE.fullmatch(f))
+    with open(os.path.join(data_dir, os.path.basename(EXCEPTIONS_FILE)), "w", encoding="utf-8") as fh:
+        for form in forms:
+            fh.write(f"{form} {lem.lemmatize(form)}\n")
+
+    return len(nouns), len(forms)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--build" in sys.argv:
+        n_lemmas, n_exc = build_tables()
+        print(f"Wrote {n_lemmas} noun lemmas and {n_exc} exceptions to {DATA_DIR}")
+    else:
+        for w in sys.argv[1:]:
+            print(w, "->", lemmatize(w))
@@ -0,0 +1,154 @@
+# utils/micro_batch.py
+#
+# Async micro-batching: concurrent callers each submit one item, and the
+# items are grouped into a single call of a batch function - one SBERT /
+# classifier forward pass for many requests instead of one per request.
+#
+# A batch is flushed when it reaches `max_batch_size` items or when its
+# oldest item has waited `max_wait_ms`, whichever comes first. The batch
+# function is synchronous and runs on a dedicated worker thread, so the
+# event loop keeps accepting requests while the models run.
+#
+# If a batch call raises, its items are retried one at a time so only the
+# item that actually fails gets the exception.
+#
+# Usage (inside a running event loop):
+#   batcher = MicroBatcher(lambda texts: encode_texts(texts), max_batch_size=32, max_wait_ms=10)
+#   vector = await batcher.submit("some text")
+#   await batcher.close()
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class MicroBatcher:
+
+    def __init__(self, batch_fn, max_batch_size: int = 32, max_wait_ms: float = 10.0, name: str = "batch"):
+        """
+        `batch_fn(items) -> results` gets a list of submitted items and must
+        return one result per item, in order. If it raises, the items are
+        re-run one per call and only the failing callers get an exception.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+
+        self._queue = None
+        self._worker = None
+        self._loop = None
+        self._executor = None
+
+        self.batches = 0
+        self.items = 0
+        self.max_seen_batch = 0
+        self.isolated_batches = 0
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            # (Re)bind to the current loop, e.g. a fresh test client
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            if self._executor is None:
+                # One thread: batches run one after another, never concurrently
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.name}-batcher")
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, item):
+        """Queue one item and wait for its result."""
+        self._ensure_started()
+        future = self._loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _next_batch(self):
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            # Take whatever is already queued without waiting
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            remaining = deadline - time.monotonic()
+            if len(batch) >= self.max_batch_size or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            # Callers that gave up (cancelled / timed out) are dropped
+            batch = [(item, fut) for item, fut in batch if not fut.done()]
+            if not batch:
+                continue
+
+            self.batches += 1
+            self.items += len(batch)
+            self.max_seen_batch = max(self.max_seen_batch, len(batch))
+            try:
+                results = await self._call(loop, [item for item, _ in batch])
+            except Exception as exc:
+                if len(batch) == 1:
+                    self._set_exception(batch[0][1], exc)
+                    continue
+                # One bad item must not fail everyone else's request
+                self.isolated_batches += 1
+                results = []
+                for item, fut in batch:
+                    try:
+                        results.append((await self._call(loop, [item]))[0])
+                    except Exception as item_exc:
+                        self._set_exception(fut, item_exc)
+                        results.append(None)
+
+            for (_, fut), result in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(result)
+
+    async def _call(self, loop, items):
+        results = await loop.run_in_executor(self._executor, self.batch_fn, items)
+        if len(results) != len(items):
+            raise RuntimeError(f"{self.name}: batch function returned {len(results)} results for {len(items)} items")
+        return results
+
+    @staticmethod
+    def _set_exception(fut, exc):
+        if not fut.done():
+            fut.set_exception(exc)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size_seen": self.max_seen_batch,
+            "isolated_batches": self.isolated_batches,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+        }
+
+    async def close(self):
+        """Stop the worker task; queued callers get a cancellation."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, fut = self._queue.get_nowait()
+                if not fut.done():
+                    fut.cancel()
+        self._worker = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -1,22 +1,22 @@
-import os
-import joblib
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from utils.text_cleaner import clean_text
+from utils.text_cleaner import clean_text, clean_many
+from utils.embedding import encode_texts
+from utils.model_registry import get_tfidf, get_hybrid_model, get_bert_model, get_hybrid_predictor
 
-# Determine model path
-BASE_DIR = os.path.dirname(os.path.dirname(__file__))
-MODELS_DIR = os.path.join(BASE_DIR, "models")
+# Models come from the shared registry (loaded lazily, once per process).
+# `tfidf`, `hybrid_model` and `bert` stay importable from here.
+_ALIASES = {
+    "tfidf": get_tfidf,
+    "hybrid_model": get_hybrid_model,
+    "bert": get_bert_model,
+}
 
-# Load models
-tfidf = joblib.load(os.path.join(MODELS_DIR, "tfidf_vectorizer.pkl"))
-hybrid_model = joblib.load(os.path.join(MODELS_DIR, "resume_hybrid_model.pkl"))
 
-# Load BERT model name
-with open(os.path.join(MODELS_DIR, "bert_model_name.txt"), "r") as f:
-    bert_model_name = f.read().strip()
+def __getattr__(name):
+    if name in _ALIASES:
+        return _ALIASES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-bert = SentenceTransformer(bert_model_name)
 
 def predict_category(resume_text: str) -> str:
     """
@@ -26,15 +26,52 @@ def predict_category(resume_text: str) -> str:
     # Cleaned text for TF-IDF
     cleaned = clean_text(resume_text)
 
-    # TF-IDF vector
-    vec_tfidf = tfidf.transform([cleaned]).toarray()
+    # TF-IDF vector (kept sparse)
+    vec_tfidf = get_tfidf().transform([cleaned])
 
     # BERT vector (use raw text)
-    vec_bert = bert.encode([resume_text])
+    vec_bert = encode_texts([resume_text])
 
-    # Hybrid feature = [BERT | TF-IDF]
-    hybrid_vec = np.hstack([vec_bert, vec_tfidf])
+    # Hybrid prediction on [BERT | TF-IDF] without densifying the TF-IDF block
+    pred = get_hybrid_predictor().predict(vec_bert, vec_tfidf)[0]
+    return pred
 
-    # Predict category
-    pred = hybrid_model.predict(hybrid_vec)[0]
-    return pred
\ No newline at end of file
+
+def predict_categories(texts, top_k: int = 3, batch_size: int = 32):
+    """
+    Batch hybrid prediction with calibrated probabilities.
+
+    Every text is embedded / vectorized in one batch and scored in one
+    vectorized pass. Returns one dict per text:
+        {"category": str, "probability": float,
+         "top_k": [(category, probability), ...]}   # best first
+    Without a calibration file (predictor.is_calibrated False) the
+    probabilities are None; top_k is still ranked by decision value.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+
+    predictor = get_hybrid_predictor()
+    vec_tfidf = get_tfidf().transform(clean_many(texts))
+    vec_bert = encode_texts(texts, batch_size=batch_size)
+    probs = predictor.predict_proba(vec_bert, vec_tfidf)
+
+    classes = predictor.classes_
+    top_k = max(1, min(top_k, probs.shape[1]))
+    # Top-k per row without a full sort, then order those k best-first
+    top = np.argpartition(-probs, top_k - 1, axis=1)[:, :top_k]
+    top_probs = np.take_along_axis(probs, top, axis=1)
+    order = np.argsort(-top_probs, axis=1, kind="stable")
+    top = np.take_along_axis(top, order, axis=1)
+    top_probs = np.take_along_axis(top_probs, order, axis=1)
+
+    calibrated = predictor.is_calibrated
+    return [
+        {
+            "category": classes[idx[0]],
+            "probability": float(p[0]) if calibrated else None,
+            "top_k": [(classes[i], float(q) if calibrated else None) for i, q in zip(idx, p)],
+        }
+        for idx, p in zip(top, top_probs)
+    ]
@@ -0,0 +1,193 @@
+# utils/model_registry.py
+#
+# One process-wide home for every model artifact.
+# Each artifact is loaded lazily on first use, exactly once, under a lock,
+# and its load time / memory cost is recorded.
+#
+# Usage:
+#   from utils.model_registry import get_tfidf, get_hybrid_model, get_bert_model, get_hybrid_predictor
+#   python -m utils.model_registry     # load everything and print the report
+
+import os
+import threading
+import time
+import joblib
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODELS_DIR = os.path.join(BASE_DIR, "models")
+
+# Local SBERT folder (used when models/bert_model_name.txt is empty)
+SBERT_PATH = os.path.join(MODELS_DIR, "all-MiniLM-L6-v2")
+
+
+def _rss_bytes():
+    """Resident memory of this process, or None if it can't be measured."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def process_memory(pid="self"):
+    """
+    Memory of a process in bytes from /proc/<pid>/smaps_rollup (Linux):
+    rss, pss (RSS with shared pages split between their users), shared and
+    private. None where smaps_rollup is not available.
+    """
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as fh:
+            for line in fh:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except (OSError, ValueError):
+        return None
+    if "Rss" not in fields:
+        return None
+    return {
+        "rss": fields["Rss"],
+        "pss": fields.get("Pss", fields["Rss"]),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+class ModelRegistry:
+
+    def __init__(self):
+        self._loaders = {}
+        self._models = {}
+        self._stats = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, loader):
+        """Register a zero-argument loader. Nothing is loaded yet."""
+        with self._lock:
+            self._loaders[name] = loader
+
+    def get(self, name: str):
+        """Return the artifact, loading it on first use."""
+        try:
+            return self._models[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            # Another thread may have finished loading while we waited
+            if name in self._models:
+                return self._models[name]
+            if name not in self._loaders:
+                raise KeyError(f"Unknown model '{name}'. Registered: {sorted(self._loaders)}")
+
+            rss_before = _rss_bytes()
+            start = time.perf_counter()
+            model = self._loaders[name]()
+            elapsed = time.perf_counter() - start
+            rss_after = _rss_bytes()
+
+            self._stats[name] = {
+                "load_seconds": round(elapsed, 4),
+                "memory_bytes": (
+                    rss_after - rss_before
+                    if rss_before is not None and rss_after is not None
+                    else None
+                ),
+            }
+            self._models[name] = model
+            return model
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def load_all(self):
+        """Load every registered artifact now (e.g. in a pre-fork parent)."""
+        for name in list(self._loaders):
+            self.get(name)
+
+    def report(self):
+        """One row per registered artifact: loaded?, load time, memory delta."""
+        with self._lock:
+            return [
+                {"name": name, "loaded": name in self._models, **self._stats.get(name, {})}
+                for name in self._loaders
+            ]
+
+
+# ------------ Artifact loaders ------------ #
+
+def sbert_source():
+    """models/bert_model_name.txt may name a model; empty means the local copy."""
+    try:
+        with open(os.path.join(MODELS_DIR, "bert_model_name.txt"), "r") as f:
+            name = f.read().strip()
+    except OSError:
+        name = ""
+
+    if not name:
+        return SBERT_PATH
+    local = os.path.join(MODELS_DIR, name)
+    return local if os.path.isdir(local) else name
+
+
+def _load_sbert():
+    # Imported here so processes that never embed don't pay for torch.
+    # RESUME_SBERT_BACKEND picks torch / int8 / onnx / onnx-int8 (utils/sbert_backends.py)
+    from utils.sbert_backends import load_sbert
+    return load_sbert(sbert_source())
+
+
+registry = ModelRegistry()
+registry.register("tfidf", lambda: joblib.load(os.path.join(MODELS_DIR, "tfidf_vectorizer.pkl")))
+registry.register("hybrid", lambda: joblib.load(os.path.join(MODELS_DIR, "resume_hybrid_model.pkl")))
+registry.register("sbert", _load_sbert)
+
+
+def _load_hybrid_predictor():
+    from utils.calibration import load_calibration
+    from utils.hybrid_predictor import HybridPredictor
+
+    model = registry.get("hybrid")
+    # Temperature from models/resume_hybrid_calibration.json, if fit for this model
+    calibration = load_calibration(classes=model.classes_)
+    temperature = calibration["temperature"] if calibration else None
+    return HybridPredictor(model, temperature=temperature)
+
+
+registry.register("hybrid_predictor", _load_hybrid_predictor)
+
+
+def get_model(name: str):
+    return registry.get(name)
+
+
+def get_tfidf():
+    return registry.get("tfidf")
+
+
+def get_hybrid_model():
+    return registry.get("hybrid")
+
+
+def get_bert_model():
+    return registry.get("sbert")
+
+
+def get_hybrid_predictor():
+    """Sparse-native predictor over the hybrid model (see utils/hybrid_predictor.py)."""
+    return registry.get("hybrid_predictor")
+
+
+if __name__ == "__main__":
+    for row in registry.report():
+        registry.get(row["name"])
+    for row in registry.report():
+        mem = row["memory_bytes"]
+        mem_txt = f"{mem / 1024 / 1024:.1f} MB" if mem is not None else "n/a"
+        print(f"{row['name']:<8} {row['load_seconds']:>8.3f}s  {mem_txt}")
@@ -0,0 +1,243 @@
+# utils/parse_pool.py
+#
+# Parallel PDF/DOCX text extraction for bulk intake.
+#
+# Documents are parsed in a process pool (one CPU-bound parse per core) and
+# results are yielded as each one finishes, not in submission order.
+# Each document gets page / character budgets and a timeout so one
+# pathological file cannot stall the batch. The timeout is enforced twice:
+# SIGALRM inside the worker (POSIX, clean error for slow Python code) and a
+# deadline in the parent, which kills and replaces the pool when a worker
+# is stuck in C code or SIGALRM is unavailable (Windows). Documents caught
+# in a killed or crashed pool are resubmitted to the new one.
+#
+# Usage:
+#   with ParsePool(max_workers=8, timeout=30, max_pages=10) as pool:
+#       for res in pool.parse(["a.pdf", ("cand-7", "cv.docx", docx_bytes)]):
+#           print(res.doc_id, res.error, res.timings)
+#
+# On Windows the caller must sit under `if __name__ == "__main__":`.
+
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple, Optional
+
+from utils.parser import extract_text_from_bytes
+
+
+class ParseResult(NamedTuple):
+    doc_id: str
+    text: str
+    error: Optional[str]
+    timings: dict
+
+
+class ParseTimeout(Exception):
+    pass
+
+
+# Extra time the parent allows on top of `timeout` (lets the in-worker
+# SIGALRM report first) and how often it checks deadlines.
+_DEADLINE_GRACE = 1.0
+_POLL_SECONDS = 0.25
+
+
+def _on_alarm(signum, frame):
+    raise ParseTimeout("document took too long to parse")
+
+
+def _parse_one(doc, max_pages, max_chars, timeout, submitted_at):
+    """Worker: (doc_id, filename, bytes-or-None) -> ParseResult."""
+    started_at = time.time()
+    doc_id, filename, file_bytes = doc
+    text, error = "", None
+
+    # Hard per-document timeout where SIGALRM exists (POSIX). Elsewhere the
+    # page / character budgets are what bound the work.
+    use_alarm = bool(timeout) and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        if file_bytes is None:
+            with open(filename, "rb") as fh:
+                file_bytes = fh.read()
+        text = extract_text_from_bytes(file_bytes, filename, max_pages=max_pages, max_chars=max_chars)
+    except ParseTimeout:
+        error = f"Timed out after {timeout}s"
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    finished_at = time.time()
+    timings = {
+        "queue_seconds": round(started_at - submitted_at, 4),
+        "parse_seconds": round(finished_at - started_at, 4),
+        "bytes": len(file_bytes) if file_bytes is not None else 0,
+    }
+    return ParseResult(doc_id, text, error, timings)
+
+
+def _normalize_doc(doc):
+    """Accept a path, (doc_id, path) or (doc_id, filename, bytes)."""
+    if isinstance(doc, (str, os.PathLike)):
+        path = os.fspath(doc)
+        return path, path, None
+    if len(doc) == 2:
+        doc_id, path = doc
+        return doc_id, os.fspath(path), None
+    return tuple(doc)
+
+
+def _kill_workers(executor):
+    """Terminate a pool's worker processes (a stuck C call ignores everything else)."""
+    kill = getattr(executor, "kill_workers", None)  # Python 3.14+
+    if kill is not None:
+        kill()
+        return
+    for proc in list((getattr(executor, "_processes", None) or {}).values()):
+        try:
+            proc.kill()
+        except (OSError, AttributeError):
+            pass
+
+
+class ParsePool:
+
+    def __init__(self, max_workers: int = None, timeout: float = 30.0,
+                 max_pages: int = None, max_chars: int = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.restarts = 0
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _restart(self, kill: bool = False):
+        """Replace the executor, killing its workers first if one is stuck."""
+        old = self._executor
+        if kill:
+            _kill_workers(old)
+        old.shutdown(wait=False, cancel_futures=True)
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self.restarts += 1
+
+    def parse(self, docs, max_in_flight: int = None):
+        """
+        Yield a ParseResult per document as soon as it is parsed.
+        At most `max_in_flight` documents (default: one per worker) are
+        submitted at once, so large batches are not all held in memory and
+        every submitted document is actually running - its deadline is
+        counted from when a worker picks it up.
+        """
+        max_in_flight = max_in_flight or self.max_workers
+        docs = iter(docs)
+        requeue = deque()   # innocent documents from a killed pool
+        suspects = deque()  # documents in flight when a worker died
+        pending = {}        # future -> [doc, suspect?, started (monotonic) or None]
+
+        def submit(doc, suspect):
+            try:
+                fut = self._executor.submit(_parse_one, doc, self.max_pages, self.max_chars, self.timeout, time.time())
+            except BrokenProcessPool:
+                self._restart()
+                fut = self._executor.submit(_parse_one, doc, self.max_pages, self.max_chars, self.timeout, time.time())
+            pending[fut] = [doc, suspect, None]
+
+        def fill():
+            # Suspects run alone, so a second crash pins down the culprit
+            if suspects:
+                if not pending:
+                    submit(suspects.popleft(), True)
+                return
+            while len(pending) < max_in_flight:
+                if requeue:
+                    doc = requeue.popleft()
+                else:
+                    try:
+                        doc = _normalize_doc(next(docs))
+                    except StopIteration:
+                        return
+                submit(doc, False)
+
+        fill()
+        while pending:
+            now = time.monotonic()
+            for fut, entry in pending.items():
+                if entry[2] is None and fut.running():
+                    entry[2] = now
+
+            wait_seconds = _POLL_SECONDS
+            if self.timeout:
+                deadlines = [e[2] + self.timeout + _DEADLINE_GRACE for e in pending.values() if e[2] is not None]
+                if deadlines:
+                    wait_seconds = min(wait_seconds, max(0.0, min(deadlines) - now))
+            done, _ = wait(pending, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+
+            broken = False
+            for fut in done:
+                doc, suspect, _ = pending.pop(fut)
+                try:
+                    yield fut.result()
+                except BrokenProcessPool as exc:
+                    broken = True
+                    if suspect:  # crashed again while running alone
+                        yield ParseResult(doc[0], "", f"{type(exc).__name__}: worker process died", {})
+                    else:
+                        suspects.append(doc)
+                except Exception as exc:
+                    yield ParseResult(doc[0], "", f"{type(exc).__name__}: {exc}", {})
+
+            if broken:
+                # A worker died (e.g. killed by the OS) and took the pool with it;
+                # everything that was in flight is retried, one at a time
+                suspects.extend(doc for doc, _, _ in pending.values())
+                pending.clear()
+                self._restart()
+
+            elif self.timeout:
+                now = time.monotonic()
+                expired = [
+                    fut for fut, e in pending.items()
+                    if e[2] is not None and now - e[2] > self.timeout + _DEADLINE_GRACE and not fut.done()
+                ]
+                if expired:
+                    for fut in expired:
+                        doc, _, started = pending.pop(fut)
+                        yield ParseResult(doc[0], "", f"Timed out after {self.timeout}s", {
+                            "queue_seconds": 0.0,
+                            "parse_seconds": round(now - started, 4),
+                            "bytes": len(doc[2]) if doc[2] is not None else 0,
+                        })
+                    # Only killing the process stops a stuck worker: replace the
+                    # pool and resubmit the documents that were running beside it
+                    for doc, suspect, _ in pending.values():
+                        (suspects if suspect else requeue).append(doc)
+                    pending.clear()
+                    self._restart(kill=True)
+
+            fill()
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parse_documents(docs, max_workers: int = None, timeout: float = 30.0,
+                    max_pages: int = None, max_chars: int = None):
+    """One-shot helper: parse `docs` in a temporary pool, yielding results."""
+    with ParsePool(max_workers=max_workers, timeout=timeout,
+                   max_pages=max_pages, max_chars=max_chars) as pool:
+        yield from pool.parse(docs)
@@ -1,33 +1,82 @@
 # utils/parser.py
 
 import fitz  # PyMuPDF
-import docx2txt
+import io
 import re
-import tempfile
-import os
+import zipfile
+import xml.etree.ElementTree as ET
 
-def extract_text_from_pdf_bytes(file_bytes: bytes) -> str:
-    """Extract text from a PDF file given as bytes."""
-    text = ""
+def iter_pdf_pages(file_bytes: bytes, max_pages: int = None):
+    """Yield the text of each PDF page in order, one page at a time."""
     with fitz.open(stream=file_bytes, filetype="pdf") as pdf:
-        for page in pdf:
-            text += page.get_text()
-    return text
+        n_pages = pdf.page_count if max_pages is None else min(max_pages, pdf.page_count)
+        for i in range(n_pages):
+            yield pdf.load_page(i).get_text()
 
-def extract_text_from_docx_bytes(file_bytes: bytes) -> str:
-    """Extract text from a DOCX file given as bytes."""
-    # docx2txt needs a file path, so we write to a temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
-        tmp.write(file_bytes)
-        tmp_path = tmp.name
 
-    try:
-        text = docx2txt.process(tmp_path)
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+def extract_text_from_pdf_bytes(file_bytes: bytes, max_pages: int = None, max_chars: int = None) -> str:
+    """
+    Extract text from a PDF file given as bytes.
+    Stops early after `max_pages` pages or `max_chars` characters;
+    pages are joined once at the end.
+    """
+    pages = []
+    total = 0
+    for page_text in iter_pdf_pages(file_bytes, max_pages=max_pages):
+        if max_chars is not None and total + len(page_text) >= max_chars:
+            pages.append(page_text[: max_chars - total])
+            break
+        pages.append(page_text)
+        total += len(page_text)
+    return "".join(pages)
+
+# WordprocessingML tags, in ElementTree's {namespace}tag form
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_T = _W_NS + "t"
+_W_P = _W_NS + "p"
+_W_TAB = _W_NS + "tab"
+_W_BREAKS = (_W_NS + "br", _W_NS + "cr")
+
+_DOCX_HEADER_RE = re.compile(r"word/header[0-9]*.xml")
+_DOCX_FOOTER_RE = re.compile(r"word/footer[0-9]*.xml")
+
+
+def _docx_part_text(zipf, name, out):
+    """Stream one DOCX XML part, appending its text pieces to `out`."""
+    with zipf.open(name) as fh:
+        for event, elem in ET.iterparse(fh, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == _W_P:
+                    out.append("\n\n")
+                elif tag == _W_TAB:
+                    out.append("\t")
+                elif tag in _W_BREAKS:
+                    out.append("\n")
+            elif tag == _W_T:
+                if elem.text:
+                    out.append(elem.text)
+            elif tag == _W_P:
+                elem.clear()  # paragraph already emitted, free its subtree
 
-    return text
+
+def extract_text_from_docx_bytes(file_bytes: bytes) -> str:
+    """
+    Extract text from a DOCX file given as bytes.
+    Reads the XML parts straight from memory (no temp file); output
+    matches docx2txt.process: headers, then body, then footers.
+    """
+    out = []
+    with zipfile.ZipFile(io.BytesIO(file_bytes)) as zipf:
+        names = zipf.namelist()
+        for name in names:
+            if _DOCX_HEADER_RE.match(name):
+                _docx_part_text(zipf, name, out)
+        _docx_part_text(zipf, "word/document.xml", out)
+        for name in names:
+            if _DOCX_FOOTER_RE.match(name):
+                _docx_part_text(zipf, name, out)
+    return "".join(out).strip()
 
 def extract_text_from_upload(uploaded_file):
     """
@@ -38,10 +87,17 @@ def extract_text_from_upload(uploaded_file):
         return ""
 
     file_bytes = uploaded_file.read()
-    name = uploaded_file.name.lower()
+    return extract_text_from_bytes(file_bytes, uploaded_file.name)
+
+def extract_text_from_bytes(file_bytes: bytes, filename: str, max_pages: int = None, max_chars: int = None) -> str:
+    """
+    Raw file bytes -> text, dispatching on the file extension.
+    Supports .pdf and .docx. `max_pages` / `max_chars` limit PDF extraction.
+    """
+    name = filename.lower()
 
     if name.endswith(".pdf"):
-        return extract_text_from_pdf_bytes(file_bytes)
+        return extract_text_from_pdf_bytes(file_bytes, max_pages=max_pages, max_chars=max_chars)
     elif name.endswith(".docx"):
         return extract_text_from_docx_bytes(file_bytes)
     else:
@@ -1,12 +1,83 @@
 # utils/report.py
 
-from fpdf import FPDF
+from fpdf import FPDF, FPDF_VERSION
 from datetime import datetime
+import copy
+import io
 import os
 import re
+import threading
+
+from utils.skills import canonicalize_skills
 
 # Path to your Unicode font (already downloaded)
-FONT_PATH = os.path.join("utils", "fonts", "DejaVuSans.ttf")
+FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts", "DejaVuSans.ttf")
+FONT_FAMILY = "DejaVu"
+FONT_STYLES = ("", "B")
+
+
+# ------------ Font cache ------------ #
+# FPDF.add_font parses the whole TTF (tables, cmap, per-glyph widths) every
+# time it is called - twice per report. The parse is done once per process
+# here; each report gets a cheap per-document copy. Per fpdf2 2.7.5
+# internals, the per-document state of a TTFFont is its index, descriptor,
+# glyph subset map, missing-glyph list and the fontTools TTFont, which is
+# subset in place when the PDF is written - so those are fresh per copy,
+# while the parsed metrics (widths, glyph ids, cmap) are shared read-only.
+# Any other fpdf2 version takes the plain add_font path.
+_FONT_CACHE_SUPPORTED = FPDF_VERSION.startswith("2.7.")
+
+_font_lock = threading.Lock()
+_font_cache = {}  # style -> (parsed TTFFont, raw font bytes)
+
+
+def _parsed_font(style: str):
+    cached = _font_cache.get(style)
+    if cached is None:
+        with _font_lock:
+            cached = _font_cache.get(style)
+            if cached is None:
+                scratch = FPDF()
+                scratch.add_font(FONT_FAMILY, style, FONT_PATH)
+                font = scratch.fonts[f"{FONT_FAMILY.lower()}{style}"]
+                with open(FONT_PATH, "rb") as fh:
+                    cached = (font, fh.read())
+                _font_cache[style] = cached
+    return cached
+
+
+def _copy_font(pdf: FPDF, style: str):
+    from fontTools import ttLib
+    from fpdf.fonts import SubsetMap
+
+    parsed, font_bytes = _parsed_font(style)
+    font = copy.copy(parsed)
+    font.i = len(pdf.fonts) + 1
+    font.desc = copy.copy(parsed.desc)
+    font.missing_glyphs = []
+    font.ttfont = ttLib.TTFont(io.BytesIO(font_bytes), recalcTimestamp=False, fontNumber=0, lazy=True)
+
+    # Same identities TTFFont.__init__ reserves
+    reserved = "\x00 \r\n"
+    if pdf.str_alias_nb_pages:
+        reserved += "0123456789" + pdf.str_alias_nb_pages
+    font.subset = SubsetMap(font, [ord(char) for char in reserved])
+    return font
+
+
+def register_report_fonts(pdf: FPDF):
+    """Add the report fonts to `pdf`, reusing the once-per-process parse."""
+    for style in FONT_STYLES:
+        if not _FONT_CACHE_SUPPORTED:
+            pdf.add_font(FONT_FAMILY, style, FONT_PATH)
+            continue
+        fontkey = f"{FONT_FAMILY.lower()}{style}"
+        try:
+            pdf.fonts[fontkey] = _copy_font(pdf, style)
+        except (AttributeError, ImportError, TypeError):
+            # fpdf2 internals differ from 2.7.x: fall back to a full parse
+            pdf.fonts.pop(fontkey, None)
+            pdf.add_font(FONT_FAMILY, style, FONT_PATH)
 
 
 # ------------ Helper functions ------------ #
@@ -157,12 +228,16 @@ def create_ats_report(
     contact_info,
     resume_text,
 ):
+    # Report skills under their canonical taxonomy names ("sklearn" -> "scikit-learn")
+    resume_skills = canonicalize_skills(resume_skills)
+    jd_skills = canonicalize_skills(jd_skills)
+    missing_skills = canonicalize_skills(missing_skills)
+
     pdf = ATSReportPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
 
-    # Register Unicode font
-    pdf.add_font("DejaVu", "", FONT_PATH, uni=True)
-    pdf.add_font("DejaVu", "B", FONT_PATH, uni=True)
+    # Register Unicode font (parsed once per process, see register_report_fonts)
+    register_report_fonts(pdf)
 
     # ---------------------- COVER-STYLE FIRST PAGE ---------------------- #
     pdf.add_page()
@@ -362,4 +437,114 @@ def create_ats_report(
 
     # Return raw bytes (works with Streamlit download_button)
     pdf_bytes = pdf.output(dest="S")
-    return bytes(pdf_bytes)
\ No newline at end of file
+    return bytes(pdf_bytes)
+
+# ------------ Shortlist cover page ------------ #
+
+def _fit_text(pdf: FPDF, text: str, width: float) -> str:
+    """Truncate `text` with an ellipsis so it fits in a cell `width` mm wide."""
+    text = str(text)
+    if pdf.get_string_width(text) <= width - 2:
+        return text
+    while text and pdf.get_string_width(text + "…") > width - 2:
+        text = text[:-1]
+    return text + "…"
+
+
+def create_shortlist_report(candidates, jd_skills=None):
+    """
+    One-page (or longer) shortlist summary: a ranked table of candidates.
+    Each candidate is a dict with rank, name, final_score,
+    skill_match_percent, predicted_category and email.
+    """
+    pdf = ATSReportPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    register_report_fonts(pdf)
+    pdf.add_page()
+
+    pdf.section_title("Candidate Shortlist")
+    summary = f"{len(candidates)} candidate(s) ranked by ATS fit score against the job description."
+    if jd_skills:
+        summary += "\nRequired skills: " + ", ".join(sorted(canonicalize_skills(jd_skills)))
+    pdf.section_text(summary)
+    pdf.ln(2)
+
+    columns = [("Rank", 14, "C"), ("Candidate", 62, "L"), ("ATS %", 20, "C"),
+               ("Skills %", 20, "C"), ("Category", 34, "L"), ("Email", 40, "L")]
+
+    def table_header():
+        pdf.set_font("DejaVu", "B", 10)
+        pdf.set_fill_color(240, 240, 240)
+        pdf.set_draw_color(200, 200, 200)
+        pdf.set_text_color(20, 20, 20)
+        for label, width, align in columns:
+            pdf.cell(width, 7, label, border=1, align=align, fill=True)
+        pdf.ln()
+        pdf.set_font("DejaVu", "", 9)
+
+    table_header()
+    for cand in candidates:
+        if pdf.will_page_break(7):
+            pdf.add_page()
+            table_header()
+        values = [
+            cand.get("rank", ""),
+            cand.get("name", ""),
+            f"{round(float(cand.get('final_score', 0)), 1)}",
+            f"{round(float(cand.get('skill_match_percent', 0)), 1)}",
+            cand.get("predicted_category") or "",
+            cand.get("email") or "Not detected",
+        ]
+        for value, (_, width, align) in zip(values, columns):
+            pdf.cell(width, 7, _fit_text(pdf, value, width), border=1, align=align)
+        pdf.ln()
+
+    return bytes(pdf.output(dest="S"))
+
+
+# ------------ Many reports at once ------------ #
+
+def _warm_report_worker():
+    """Pool initializer: parse the fonts once per worker process."""
+    for style in FONT_STYLES:
+        _parsed_font(style)
+
+
+def _create_report_from_kwargs(kwargs):
+    return create_ats_report(**kwargs)
+
+
+def generate_reports(records, workers: int = None, max_in_flight: int = None):
+    """
+    Yield PDF bytes for each record (a dict of create_ats_report keyword
+    arguments), in input order.
+
+    Report layout is pure Python, so threads would serialize on the GIL;
+    with `workers` > 1 reports are built in a process pool whose workers
+    each parse the fonts once up front. workers=None uses every CPU.
+    `records` is consumed lazily and at most `max_in_flight` reports
+    (default 4 per worker) are queued or waiting to be consumed at once.
+    """
+    workers = workers or os.cpu_count() or 1
+    if hasattr(records, "__len__"):
+        workers = min(workers, len(records))
+    if workers <= 1:
+        for kwargs in records:
+            yield create_ats_report(**kwargs)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_in_flight = max_in_flight or workers * 4
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_report_worker)
+    pending = deque()
+    try:
+        for kwargs in records:
+            pending.append(pool.submit(_create_report_from_kwargs, kwargs))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
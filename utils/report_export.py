@@ -0,0 +1,293 @@
+# utils/report_export.py
+#
+# Bulk ATS report export for a shortlist of screened candidates:
+#   - a ZIP with one PDF report per candidate
+#   - one merged PDF: shortlist cover page + every report, with bookmarks
+#
+# Reports are rendered in a process pool (utils.report.generate_reports) and
+# written out as each one arrives, so only the in-flight PDFs are in memory.
+# The merged PDF is built on disk: every RESUME_EXPORT_MERGE_CHUNK reports
+# (default 25) it is saved incrementally and reopened, so PyMuPDF never
+# holds more than one chunk of pages regardless of the shortlist size.
+#
+# Usage (from the project root):
+#   python -m utils.report_export --jd job_description.txt resumes/ --top 10 -o shortlist.zip
+#   python -m utils.report_export --jd job_description.txt resumes/ --top 10 -o shortlist.pdf
+#
+# From code, on utils.batch.screen_resumes() results:
+#   jobs = shortlist_jobs(df, profile, texts={"cv.pdf": text, ...}, top_n=10)
+#   export_zip(jobs, "shortlist.zip", progress=lambda done, total, name: ...)
+
+import argparse
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+from typing import NamedTuple
+
+from utils.job_profile import JobProfile
+from utils.report import create_shortlist_report, generate_reports
+
+MERGE_CHUNK = int(os.environ.get("RESUME_EXPORT_MERGE_CHUNK", "25"))
+
+
+class ReportJob(NamedTuple):
+    rank: int
+    name: str
+    report: dict  # create_ats_report keyword arguments
+
+
+# ----------------------------------------------------------
+# Screening results -> report jobs
+# ----------------------------------------------------------
+def _split_skills(value):
+    if isinstance(value, str):
+        return [s.strip() for s in value.split(",") if s.strip()]
+    return list(value or [])
+
+
+def _value(value, default=None):
+    """Row value with pandas NaN / None mapped to `default`."""
+    if value is None or value != value:
+        return default
+    return value
+
+
+def shortlist_jobs(results, job_description, texts=None, top_n: int = None):
+    """
+    ReportJobs for the top `top_n` parsed candidates of a screen_resumes()
+    DataFrame (already ranked). `texts` maps file name -> resume text and
+    feeds the writing-quality section; it is left empty for missing files.
+    """
+    profile = job_description if isinstance(job_description, JobProfile) else JobProfile(job_description)
+    texts = texts or {}
+    jd_skills = profile.skill_list
+
+    ok = results[results["error"].isna()] if "error" in results else results
+    if top_n:
+        ok = ok.head(top_n)
+
+    jobs = []
+    for row in ok.to_dict("records"):
+        name = row["file"]
+        jobs.append(ReportJob(int(row["rank"]), name, dict(
+            final_score=float(row["final_score"]),
+            skill_match_percent=float(row["skill_match_percent"]),
+            bert_score=float(row["bert_score"]),
+            tfidf_sim=float(row["tfidf_sim"]),
+            exp_score=float(row["exp_score"]),
+            edu_score=float(row["edu_score"]),
+            experience_years=_value(row.get("experience_years"), 0),
+            education_level=_value(row.get("education_level"), "Not detected"),
+            resume_skills=_split_skills(_value(row.get("resume_skills"), "")),
+            jd_skills=jd_skills,
+            missing_skills=_split_skills(_value(row.get("missing_skills"), "")),
+            predicted_category=_value(row.get("predicted_category"), ""),
+            model_confidence=float(_value(row.get("model_confidence"), 0.0)),
+            contact_info={"email": _value(row.get("email")), "phone": _value(row.get("phone"))},
+            resume_text=texts.get(name, ""),
+        )))
+    return jobs
+
+
+def report_filename(job: ReportJob) -> str:
+    """Safe, rank-prefixed file name for a candidate's report."""
+    stem = os.path.splitext(os.path.basename(job.name))[0]
+    stem = re.sub(r"[^A-Za-z0-9._-]+", "_", stem).strip("._") or "candidate"
+    return f"{job.rank:03d}_{stem}_ats_report.pdf"
+
+
+def _cover_rows(jobs):
+    return [
+        {
+            "rank": job.rank,
+            "name": job.name,
+            "final_score": job.report["final_score"],
+            "skill_match_percent": job.report["skill_match_percent"],
+            "predicted_category": job.report["predicted_category"],
+            "email": job.report["contact_info"].get("email"),
+        }
+        for job in jobs
+    ]
+
+
+# ----------------------------------------------------------
+# Export
+# ----------------------------------------------------------
+def _rendered(jobs, workers, progress):
+    """Yield (job, pdf_bytes) in order, calling progress(done, total, name)."""
+    jobs = list(jobs)
+    reports = generate_reports([job.report for job in jobs], workers=workers)
+    for done, (job, pdf_bytes) in enumerate(zip(jobs, reports), start=1):
+        yield job, pdf_bytes
+        if progress:
+            progress(done, len(jobs), job.name)
+
+
+def export_zip(jobs, target, workers: int = None, progress=None, cover: bool = True) -> int:
+    """
+    Write one PDF per job (plus a 000_shortlist.pdf cover when `cover`) into a ZIP at
+    `target` (a path or a writable binary file object, e.g. io.BytesIO).
+    Returns the number of candidate reports written.
+    """
+    jobs = list(jobs)
+    count = 0
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        if cover and jobs:
+            jd_skills = jobs[0].report["jd_skills"]
+            zf.writestr("000_shortlist.pdf", create_shortlist_report(_cover_rows(jobs), jd_skills))
+        for job, pdf_bytes in _rendered(jobs, workers, progress):
+            zf.writestr(report_filename(job), pdf_bytes)
+            count += 1
+    return count
+
+
+class _PdfAppender:
+    """
+    Appends PDFs to a file at `path`. Every `chunk` documents the file is
+    saved incrementally and reopened, which drops the pages PyMuPDF has
+    loaded so far.
+    """
+
+    def __init__(self, path, chunk: int = MERGE_CHUNK):
+        import fitz  # PyMuPDF
+
+        self._open = fitz.open
+        self.path = path
+        self.chunk = max(1, chunk)
+        self.doc = fitz.open()
+        self._on_disk = False
+        self._unsaved = 0
+
+    @property
+    def page_count(self) -> int:
+        return self.doc.page_count
+
+    def append(self, pdf_bytes: bytes):
+        with self._open(stream=pdf_bytes, filetype="pdf") as src:
+            self.doc.insert_pdf(src)
+        self._unsaved += 1
+        if self._unsaved >= self.chunk:
+            self._save()
+            self.doc.close()
+            self.doc = self._open(self.path)
+
+    def _save(self):
+        if self._on_disk:
+            self.doc.saveIncr()
+        else:
+            self.doc.save(self.path, deflate=True)
+            self._on_disk = True
+        self._unsaved = 0
+
+    def finish(self, toc=None):
+        """Write the outline (bookmarks) and everything not saved yet."""
+        if toc:
+            self.doc.set_toc(toc)
+        self._save()
+        self.doc.close()
+
+    def close(self):
+        if not self.doc.is_closed:
+            self.doc.close()
+
+
+def export_merged_pdf(jobs, target, workers: int = None, progress=None, cover: bool = True,
+                      chunk: int = MERGE_CHUNK) -> int:
+    """
+    Write the shortlist cover page and every report into one PDF at
+    `target` (a path or a writable binary file object), with one bookmark
+    per candidate. The PDF is assembled in a temporary file next to
+    `target` (or in the temp dir for file objects), saved incrementally
+    every `chunk` reports, so memory does not grow with the shortlist.
+    Returns the number of candidate reports written.
+    """
+    jobs = list(jobs)
+    to_path = isinstance(target, (str, os.PathLike))
+    if to_path:
+        part = f"{os.fspath(target)}.{os.getpid()}.part"
+    else:
+        fd, part = tempfile.mkstemp(suffix=".pdf")
+        os.close(fd)
+        os.remove(part)  # PyMuPDF creates it on the first save
+
+    merged = _PdfAppender(part, chunk)
+    toc = []
+    count = 0
+    try:
+        if cover and jobs:
+            jd_skills = jobs[0].report["jd_skills"]
+            merged.append(create_shortlist_report(_cover_rows(jobs), jd_skills))
+            toc.append([1, "Candidate Shortlist", 1])
+
+        for job, pdf_bytes in _rendered(jobs, workers, progress):
+            toc.append([1, f"{job.rank}. {job.name}", merged.page_count + 1])
+            merged.append(pdf_bytes)
+            count += 1
+
+        merged.finish(toc)
+        if to_path:
+            os.replace(part, os.fspath(target))
+        else:
+            with open(part, "rb") as fh:
+                shutil.copyfileobj(fh, target)
+    finally:
+        merged.close()
+        if os.path.exists(part):
+            os.remove(part)
+    return count
+
+
+def export_reports(jobs, target, fmt: str = None, workers: int = None, progress=None) -> int:
+    """export_zip / export_merged_pdf, chosen by `fmt` ("zip" / "pdf") or the target's extension."""
+    if fmt is None and isinstance(target, (str, os.PathLike)):
+        fmt = os.path.splitext(os.fspath(target))[1].lower().lstrip(".")
+    if fmt == "zip":
+        return export_zip(jobs, target, workers=workers, progress=progress)
+    if fmt == "pdf":
+        return export_merged_pdf(jobs, target, workers=workers, progress=progress)
+    raise ValueError("Unsupported export format. Use .zip or .pdf.")
+
+
+# ----------------------------------------------------------
+# CLI
+# ----------------------------------------------------------
+def main(argv=None):
+    from utils.batch import screen_resumes, _iter_texts
+
+    parser = argparse.ArgumentParser(
+        description="Screen resumes against a job description and export ATS reports for the top candidates."
+    )
+    parser.add_argument("resumes", nargs="+", help="Resume folder or resume files")
+    parser.add_argument("--jd", required=True, help="Path to a job description text file")
+    parser.add_argument("-o", "--output", default="shortlist.zip", help="Output file (.zip or .pdf)")
+    parser.add_argument("--top", type=int, default=10, help="Export reports for the top N candidates")
+    parser.add_argument("--workers", type=int, default=None, help="Parse / render in N processes")
+    args = parser.parse_args(argv)
+
+    with open(args.jd, "r", encoding="utf-8") as fh:
+        profile = JobProfile(fh.read())
+
+    resumes = args.resumes[0] if len(args.resumes) == 1 and os.path.isdir(args.resumes[0]) else args.resumes
+    df = screen_resumes(resumes, profile, workers=args.workers)
+
+    # screen_resumes keeps only scores; re-read the text of the shortlisted files
+    shortlisted = set(df[df["error"].isna()].head(args.top)["file"])
+    if isinstance(resumes, str):  # a folder
+        paths = [os.path.join(resumes, name) for name in sorted(shortlisted)]
+    else:
+        paths = [p for p in resumes if os.path.basename(p) in shortlisted]
+    texts = {name: text for name, text, error in _iter_texts(paths) if not error}
+
+    jobs = shortlist_jobs(df, profile, texts=texts, top_n=args.top)
+
+    def progress(done, total, name):
+        print(f"[{done}/{total}] {name}")
+
+    count = export_reports(jobs, args.output, workers=args.workers, progress=progress)
+    print(f"Exported {count} reports -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+# utils/resume_index.py
+#
+# Persistent index over every ingested resume, for
+# "find the best candidates for this JD" queries.
+#
+# On-disk layout (one folder per index):
+#   embeddings.f32  raw float32 matrix (rows x dim) of L2-normalized SBERT vectors,
+#                   opened as a read-only memmap and appended to on add()
+#   tfidf.npz       sparse TF-IDF matrix (same row order)
+#   meta.json       row ids, tombstones and rule-based features for reranking
+#
+# Usage:
+#   index = ResumeIndex("data/resume_index")
+#   index.add(["cand-1", "cand-2"], [text1, text2])
+#   index.save()
+#   top = index.search(job_description, k=10)
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from utils.embedding import encode_texts
+from utils.model_registry import get_tfidf
+from utils.features import extract_resume_features
+from utils.parser import extract_text_from_bytes
+from utils.job_profile import JobProfile
+from utils.scoring import score_experience, score_education, final_ats_scores, rank_scores
+
+EMBEDDINGS_FILE = "embeddings.f32"
+TFIDF_FILE = "tfidf.npz"
+META_FILE = "meta.json"
+
+# Rows scored per matrix product, bounds memory on very large memmaps
+SEARCH_BLOCK_ROWS = 65536
+
+
+def _normalize_rows(mat):
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    return (mat / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+class ResumeIndex:
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+        self.dim = None
+        self.ids = []          # row -> resume id
+        self.alive = []        # row -> False once deleted (tombstone)
+        self.features = []     # row -> dict of rule-based features
+        self._row_of = {}      # live resume id -> row
+        self._tfidf = None
+        self._emb = None       # read-only memmap over EMBEDDINGS_FILE
+
+        if os.path.exists(self._file(META_FILE)):
+            self._load()
+
+    # ------------ Persistence ------------ #
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _load(self):
+        with open(self._file(META_FILE), "r", encoding="utf-8") as fh:
+            meta = json.load(fh)
+        self.dim = meta["dim"]
+        self.ids = meta["ids"]
+        self.alive = meta["alive"]
+        self.features = meta["features"]
+        self._row_of = {rid: i for i, rid in enumerate(self.ids) if self.alive[i]}
+        if os.path.exists(self._file(TFIDF_FILE)):
+            self._tfidf = sp.load_npz(self._file(TFIDF_FILE)).tocsr()
+        self._open_embeddings()
+
+    def _open_embeddings(self):
+        rows = len(self.ids)
+        if rows == 0:
+            self._emb = np.zeros((0, self.dim or 0), dtype=np.float32)
+        else:
+            self._emb = np.memmap(self._file(EMBEDDINGS_FILE), dtype=np.float32,
+                                  mode="r", shape=(rows, self.dim))
+
+    def save(self):
+        """Persist TF-IDF matrix and metadata (embeddings are written on add)."""
+        if self._tfidf is not None:
+            sp.save_npz(self._file(TFIDF_FILE), self._tfidf)
+        meta = {
+            "dim": self.dim,
+            "ids": self.ids,
+            "alive": self.alive,
+            "features": self.features,
+        }
+        tmp = self._file(META_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(meta, fh)
+        os.replace(tmp, self._file(META_FILE))
+
+    def compact(self):
+        """Drop deleted rows from disk and rewrite the index."""
+        keep = np.flatnonzero(self.alive)
+        if len(keep) == len(self.ids):
+            return
+
+        emb = np.array(self._emb[keep], dtype=np.float32)
+        self._emb = None  # release the memmap before rewriting the file
+        emb.tofile(self._file(EMBEDDINGS_FILE))
+
+        self._tfidf = self._tfidf[keep]
+        self.ids = [self.ids[i] for i in keep]
+        self.features = [self.features[i] for i in keep]
+        self.alive = [True] * len(self.ids)
+        self._row_of = {rid: i for i, rid in enumerate(self.ids)}
+        self._open_embeddings()
+        self.save()
+
+    # ------------ Incremental updates ------------ #
+
+    def add(self, ids, texts, batch_size: int = 32):
+        """
+        Add (or replace) resumes. Embeddings are encoded in one batch and
+        appended to the on-disk matrix; call save() to persist metadata.
+        An id given more than once keeps only its last text.
+        """
+        ids = list(ids)
+        texts = list(texts)
+        if len(ids) != len(texts):
+            raise ValueError("ids and texts must have the same length.")
+        if not ids:
+            return
+
+        last = {rid: i for i, rid in enumerate(ids)}
+        if len(last) != len(ids):
+            keep = sorted(last.values())
+            ids = [ids[i] for i in keep]
+            texts = [texts[i] for i in keep]
+
+        self.remove([rid for rid in ids if rid in self._row_of])
+
+        tfidf = get_tfidf()
+        features = [extract_resume_features(t) for t in texts]
+        emb = _normalize_rows(encode_texts(texts, batch_size=batch_size))
+        tfidf_mat = tfidf.transform([f.cleaned_text for f in features]).tocsr()
+
+        if self.dim is None:
+            self.dim = emb.shape[1]
+        with open(self._file(EMBEDDINGS_FILE), "a+b") as fh:
+            # Drop any rows left behind by an add() that was never saved
+            fh.truncate(len(self.ids) * self.dim * 4)
+            fh.write(np.ascontiguousarray(emb).tobytes())
+
+        self._tfidf = tfidf_mat if self._tfidf is None else sp.vstack([self._tfidf, tfidf_mat]).tocsr()
+
+        for rid, feats in zip(ids, features):
+            self._row_of[rid] = len(self.ids)
+            self.ids.append(rid)
+            self.alive.append(True)
+            self.features.append({
+                "skills": feats.skills,
+                "experience_years": feats.experience_years,
+                "education_level": feats.education_level,
+                "email": feats.email,
+                "phone": feats.phone,
+            })
+
+        self._open_embeddings()
+
+    def add_files(self, paths, batch_size: int = 32):
+        """Parse PDF/DOCX files and add them using the file name as id."""
+        ids, texts = [], []
+        for path in paths:
+            with open(path, "rb") as fh:
+                texts.append(extract_text_from_bytes(fh.read(), path))
+            ids.append(os.path.basename(path))
+        self.add(ids, texts, batch_size=batch_size)
+
+    def remove(self, ids):
+        """Tombstone resumes by id; compact() reclaims the space."""
+        for rid in ids:
+            row = self._row_of.pop(rid, None)
+            if row is not None:
+                self.alive[row] = False
+
+    def __len__(self):
+        return len(self._row_of)
+
+    def __contains__(self, rid):
+        return rid in self._row_of
+
+    # ------------ Search ------------ #
+
+    def _dense_scores(self, query):
+        """Cosine score of every row against a normalized query vector."""
+        n = len(self.ids)
+        scores = np.empty(n, dtype=np.float32)
+        for start in range(0, n, SEARCH_BLOCK_ROWS):
+            stop = min(start + SEARCH_BLOCK_ROWS, n)
+            scores[start:stop] = self._emb[start:stop] @ query
+        scores[~np.asarray(self.alive, dtype=bool)] = -np.inf
+        return scores
+
+    def search(self, job_description: str, k: int = 10, candidates: int = None,
+               weights: dict = None) -> pd.DataFrame:
+        """
+        Top-k resumes for a job description.
+
+        Stage 1 shortlists `candidates` rows by SBERT cosine similarity
+        (one matrix product over the memmap). Stage 2 reranks the shortlist
+        with the full ATS formula (vectorized over the shortlist).
+
+        `job_description` is the JD text or a prebuilt JobProfile;
+        `weights` overrides entries of scoring.ATS_WEIGHTS.
+        """
+        if len(self) == 0:
+            return pd.DataFrame()
+
+        candidates = min(candidates or max(k * 5, 50), len(self))
+
+        profile = job_description if isinstance(job_description, JobProfile) else JobProfile(job_description)
+        query = _normalize_rows(profile.embedding[None, :])[0]
+        bert_scores = self._dense_scores(query)
+
+        shortlist = np.argpartition(-bert_scores, candidates - 1)[:candidates]
+
+        tfidf_sims = (self._tfidf[shortlist] @ profile.tfidf_vector.T).toarray().ravel()
+
+        feats = [self.features[row] for row in shortlist]
+        skill_match = np.array([profile.skill_match(f["skills"]) for f in feats])
+        exp_scores = np.array([score_experience(f["experience_years"], profile) for f in feats])
+        edu_scores = np.array([score_education(f["education_level"], profile) for f in feats])
+        shortlist_bert = bert_scores[shortlist]
+
+        final_scores = final_ats_scores(
+            skill_match, shortlist_bert, tfidf_sims, exp_scores, edu_scores, weights=weights
+        )
+
+        rows = []
+        for i in rank_scores(final_scores, top_k=k):
+            row = shortlist[i]
+            rows.append({
+                "rank": len(rows) + 1,
+                "id": self.ids[row],
+                "final_score": float(final_scores[i]),
+                "skill_match_percent": round(float(skill_match[i]) * 100, 2),
+                "bert_score": float(shortlist_bert[i]),
+                "tfidf_sim": float(tfidf_sims[i]),
+                "exp_score": float(exp_scores[i]),
+                "edu_score": float(edu_scores[i]),
+                "experience_years": feats[i]["experience_years"],
+                "education_level": feats[i]["education_level"],
+                "email": feats[i]["email"],
+                "phone": feats[i]["phone"],
+                "missing_skills": ", ".join(profile.missing_skills(feats[i]["skills"])),
+            })
+
+        return pd.DataFrame(rows)
@@ -0,0 +1,231 @@
+# utils/sbert_backends.py
+#
+# CPU inference backends for the SBERT (all-MiniLM-L6-v2) encoder.
+#
+# Selected with RESUME_SBERT_BACKEND (default "torch"):
+#   torch      full-precision PyTorch SentenceTransformer (original behaviour)
+#   int8       PyTorch with dynamic int8 quantization of every nn.Linear
+#   onnx       ONNX Runtime on <model>/onnx/model.onnx
+#   onnx-int8  ONNX Runtime on <model>/onnx/model_int8.onnx (int8 weights)
+#
+# The ONNX files are exported once from the local model:
+#   python -m utils.sbert_backends --export [--quantize]
+#
+# Every backend exposes the subset of SentenceTransformer used here:
+#   encode(texts, batch_size=..., convert_to_numpy=True, show_progress_bar=False)
+#   get_sentence_embedding_dimension()
+#
+# Compare drift / throughput with benchmarks/bench_sbert_backends.py.
+
+import argparse
+import inspect
+import json
+import os
+import threading
+
+import numpy as np
+
+BACKENDS = ("torch", "int8", "onnx", "onnx-int8")
+SBERT_BACKEND = os.environ.get("RESUME_SBERT_BACKEND", "torch").strip().lower() or "torch"
+
+ONNX_DIR = "onnx"
+ONNX_FILES = {"onnx": "model.onnx", "onnx-int8": "model_int8.onnx"}
+
+
+def load_sbert(source: str, backend: str = None):
+    """Load the encoder at `source` with the given (or configured) backend."""
+    backend = (backend or SBERT_BACKEND).lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown SBERT backend '{backend}'. Choose one of: {', '.join(BACKENDS)}")
+
+    if backend in ONNX_FILES:
+        return OnnxSentenceEncoder(source, os.path.join(source, ONNX_DIR, ONNX_FILES[backend]))
+
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(source, device="cpu")
+    if backend == "int8":
+        import torch
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+
+# ------------------------------------------
+# ONNX Runtime encoder
+# ------------------------------------------
+class OnnxSentenceEncoder:
+    """
+    SentenceTransformer-compatible encoder on ONNX Runtime.
+    Tokenization uses the model's tokenizer.json (no torch / transformers
+    import), pooling and normalization follow the model's module config.
+
+    The model file is read at load time, but the InferenceSession (and its
+    intra-op thread pool) is only built on first use, in the process that
+    encodes. Threads do not survive fork(), so a pre-fork parent can load
+    this encoder and its workers share the model bytes copy-on-write.
+    """
+
+    def __init__(self, source: str, onnx_path: str):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as exc:
+            raise ImportError(
+                "The ONNX SBERT backend needs `onnxruntime` and `tokenizers` "
+                "(pip install onnxruntime tokenizers)"
+            ) from exc
+
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(
+                f"{onnx_path} not found. Export it with: python -m utils.sbert_backends --export"
+                + (" --quantize" if onnx_path.endswith("_int8.onnx") else "")
+            )
+
+        self.max_seq_length = _read_json(os.path.join(source, "sentence_bert_config.json")).get("max_seq_length", 256)
+        pooling = _read_json(os.path.join(source, "1_Pooling", "config.json"))
+        if pooling and not pooling.get("pooling_mode_mean_tokens", True):
+            raise ValueError("Only mean pooling is supported by the ONNX backend")
+        modules = _read_json(os.path.join(source, "modules.json")) or []
+        self.normalize = any(m.get("type", "").endswith("Normalize") for m in modules)
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(source, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self.max_seq_length)
+        self.tokenizer.enable_padding()
+
+        self.onnx_path = onnx_path
+        with open(onnx_path, "rb") as fh:
+            self._model_bytes = fh.read()
+        self._dim = _read_json(os.path.join(source, "config.json")).get("hidden_size")
+        self._session = None
+        self._session_pid = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The InferenceSession for this process, built on first use."""
+        if self._session is None or self._session_pid != os.getpid():
+            with self._session_lock:
+                if self._session is None or self._session_pid != os.getpid():
+                    import onnxruntime as ort
+
+                    options = ort.SessionOptions()
+                    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                    session = ort.InferenceSession(self._model_bytes, options, providers=["CPUExecutionProvider"])
+                    self._input_names = {i.name for i in session.get_inputs()}
+                    self._dim = session.get_outputs()[0].shape[-1]
+                    self._session, self._session_pid = session, os.getpid()
+        return self._session
+
+    @property
+    def has_session(self) -> bool:
+        """True once this process has built its InferenceSession."""
+        return self._session is not None and self._session_pid == os.getpid()
+
+    def get_sentence_embedding_dimension(self):
+        if self._dim is None:
+            self.session
+        return self._dim
+
+    def _encode_batch(self, texts):
+        encodings = self.tokenizer.encode_batch(texts)
+        feeds = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        session = self.session
+        feeds = {k: v for k, v in feeds.items() if k in self._input_names}
+        hidden = session.run(None, feeds)[0]
+
+        # Mean pooling over real (non-padding) tokens
+        mask = feeds["attention_mask"][:, :, None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        if self.normalize:
+            pooled /= np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+        return pooled.astype(np.float32, copy=False)
+
+    def encode(self, sentences, batch_size: int = 32, convert_to_numpy: bool = True,
+               show_progress_bar: bool = False, **kwargs):
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        dim = self.get_sentence_embedding_dimension()
+        if not texts:
+            return np.zeros((0, dim), dtype=np.float32)
+        # Like SentenceTransformer: batch by length so padding stays short
+        order = np.argsort([-len(t) for t in texts], kind="stable")
+        ordered = [texts[i] for i in order]
+        out = np.empty((len(texts), dim), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            out[order[start:start + batch_size]] = self._encode_batch(ordered[start:start + batch_size])
+        return out[0] if single else out
+
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+# ------------------------------------------
+# Export
+# ------------------------------------------
+def export_onnx(source: str, quantize: bool = False, opset: int = 14):
+    """Export the transformer of `source` to <source>/onnx/model.onnx (+ int8 copy)."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    out_dir = os.path.join(source, ONNX_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    onnx_path = os.path.join(out_dir, ONNX_FILES["onnx"])
+
+    model = SentenceTransformer(source, device="cpu")
+    transformer = model[0].auto_model.eval()
+    sample = model.tokenizer(["an example resume sentence"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        kwargs["dynamo"] = False  # the TorchScript exporter handles dynamic_axes
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(sample[name] for name in input_names),
+            onnx_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+            **kwargs,
+        )
+    paths = [onnx_path]
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        int8_path = os.path.join(out_dir, ONNX_FILES["onnx-int8"])
+        quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QInt8)
+        paths.append(int8_path)
+    return paths
+
+
+def main(argv=None):
+    from utils.model_registry import sbert_source
+
+    parser = argparse.ArgumentParser(description="SBERT inference backends")
+    parser.add_argument("--export", action="store_true", help="export the local model to ONNX")
+    parser.add_argument("--quantize", action="store_true", help="also write an int8-quantized ONNX model")
+    parser.add_argument("--model", default=None, help="model folder (default: the configured local SBERT)")
+    args = parser.parse_args(argv)
+
+    if not args.export:
+        parser.print_help()
+        return
+    for path in export_onnx(args.model or sbert_source(), quantize=args.quantize):
+        print(f"Wrote {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,58 +1,150 @@
 # utils/scoring.py
 
-def score_experience(resume_years, jd_text):
+import re
+
+# "X years" / "X+ years" requirement in a job description
+_REQUIRED_YEARS_RE = re.compile(r"(\d+)\+?\s*years?")
+
+DEGREE_RANK = {
+    "Not Found": 0,
+    "Associate Degree": 1,
+    "Bachelor's": 2,
+    "Master's": 3,
+    "PhD": 4
+}
+
+
+def required_experience_years(jd_text):
+    """First "X years" figure in the JD, or None if it doesn't mention one."""
+    match = _REQUIRED_YEARS_RE.search(jd_text.lower())
+    return int(match.group(1)) if match else None
+
+
+def required_degree_rank(jd_text):
+    """Highest degree the JD asks for, as a DEGREE_RANK value (0 = none)."""
+    jd_text = jd_text.lower()
+
+    # Prioritize: PhD > Master > Bachelor
+    if "phd" in jd_text or "doctorate" in jd_text:
+        return 4
+    elif "master" in jd_text or "m.sc" in jd_text or "m.s" in jd_text or "mba" in jd_text:
+        return 3
+    elif "bachelor" in jd_text or "b.sc" in jd_text or "b.s" in jd_text:
+        return 2
+    return 0
+
+
+def score_experience(resume_years, jd):
     """
     Compare resume experience with job description requirements.
     If JD mentions required years, compare them.
     If JD doesn't mention years, give full score.
+
+    `jd` is the JD text or a JobProfile (requirement parsed once).
     """
-    import re
+    required = jd.required_years if hasattr(jd, "required_years") else required_experience_years(jd)
 
-    # Look for "X years" requirement in job description
-    match = re.search(r"(\d+)\+?\s*years?", jd_text.lower())
-    
-    if match:
-        required = int(match.group(1))
+    if required is not None:
         return min(1.0, resume_years / required)  # cap at 1.0
     else:
         return 1.0  # If JD doesn't mention years → full score
 
 
-def score_education(resume_degree, jd_text):
-    jd_text = jd_text.lower()
-
-    # Prioritize: PhD > Master > Bachelor
-    degree_rank = {
-        "Not Found": 0,
-        "Associate Degree": 1,
-        "Bachelor's": 2,
-        "Master's": 3,
-        "PhD": 4
-    }
-
-    # Detect requirements
-    required = 0
-    if "phd" in jd_text or "doctorate" in jd_text:
-        required = 4
-    elif "master" in jd_text or "m.sc" in jd_text or "m.s" in jd_text or "mba" in jd_text:
-        required = 3
-    elif "bachelor" in jd_text or "b.sc" in jd_text or "b.s" in jd_text:
-        required = 2
+def score_education(resume_degree, jd):
+    """`jd` is the JD text or a JobProfile (requirement parsed once)."""
+    required = jd.required_degree_rank if hasattr(jd, "required_degree_rank") else required_degree_rank(jd)
 
-    resume_rank = degree_rank.get(resume_degree, 0)
+    resume_rank = DEGREE_RANK.get(resume_degree, 0)
 
     return 1.0 if resume_rank >= required else resume_rank / max(required, 1)
 
 
-def final_ats_score(skill_match, bert_sim, tfidf_sim, exp_score, edu_score):
+# Weights of each component in the final ATS score (sum to 1.0)
+ATS_WEIGHTS = {
+    "skill_match": 0.40,
+    "bert": 0.30,
+    "tfidf": 0.10,
+    "experience": 0.10,
+    "education": 0.10,
+}
+
+
+def resolve_weights(weights=None):
+    """ATS_WEIGHTS with any overrides from `weights` applied."""
+    if not weights:
+        return ATS_WEIGHTS
+    unknown = set(weights) - set(ATS_WEIGHTS)
+    if unknown:
+        raise ValueError(f"Unknown ATS weight(s): {', '.join(sorted(unknown))}")
+    return {**ATS_WEIGHTS, **weights}
+
+
+def final_ats_score(skill_match, bert_sim, tfidf_sim, exp_score, edu_score, weights=None):
     """
     Weighted ATS Score (0–100)
     """
+    w = resolve_weights(weights)
     final = (
-        skill_match * 0.40 +
-        bert_sim * 0.30 +
-        tfidf_sim * 0.10 +
-        exp_score * 0.10 +
-        edu_score * 0.10
+        skill_match * w["skill_match"] +
+        bert_sim * w["bert"] +
+        tfidf_sim * w["tfidf"] +
+        exp_score * w["experience"] +
+        edu_score * w["education"]
     )
-    return round(final * 100, 2)
\ No newline at end of file
+    return round(final * 100, 2)
+
+
+# ------------------------------------------
+# Vectorized scoring (N candidates at once)
+# ------------------------------------------
+# numpy is imported inside these functions: the per-candidate helpers above
+# are imported at page / API start-up, where numpy would add ~100 ms.
+def final_ats_scores(skill_match, bert_sim, tfidf_sim, exp_score, edu_score, weights=None):
+    """
+    final_ats_score for N candidates. Each argument is an array of length N
+    (or a scalar, broadcast to every candidate). Returns float64 scores
+    (0–100, rounded to 2 decimals).
+    """
+    import numpy as np
+
+    w = resolve_weights(weights)
+    parts = [
+        (np.asarray(skill_match), w["skill_match"]),
+        (np.asarray(bert_sim), w["bert"]),
+        (np.asarray(tfidf_sim), w["tfidf"]),
+        (np.asarray(exp_score), w["experience"]),
+        (np.asarray(edu_score), w["education"]),
+    ]
+    final = np.zeros(np.broadcast_shapes(*(values.shape for values, _ in parts)), dtype=np.float64)
+    for values, weight in parts:
+        final += values * weight
+    final *= 100
+    return np.round(final, 2, out=final)
+
+
+def rank_scores(scores, top_k=None):
+    """
+    Candidate indices ordered best-first (ties keep input order).
+    With `top_k`, only the best k are selected and sorted.
+    """
+    import numpy as np
+
+    scores = np.asarray(scores)
+    n = len(scores)
+    if top_k is None or top_k >= n:
+        return np.argsort(-scores, kind="stable")
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Select the top k without sorting everything, then sort just those.
+    # Candidates tied with the k-th score are all kept so ties stay stable.
+    kth = -np.partition(-scores, top_k - 1)[top_k - 1]
+    idx = np.flatnonzero(scores >= kth)
+    order = idx[np.argsort(-scores[idx], kind="stable")]
+    return order[:top_k]
+
+
+def score_candidates(skill_match, bert_sim, tfidf_sim, exp_score, edu_score, weights=None, top_k=None):
+    """Vectorized scores for N candidates plus their ranking: (scores, order)."""
+    scores = final_ats_scores(skill_match, bert_sim, tfidf_sim, exp_score, edu_score, weights=weights)
+    return scores, rank_scores(scores, top_k=top_k)
@@ -0,0 +1,137 @@
+# utils/skill_matcher.py
+#
+# Multi-pattern matcher for skill phrases.
+#
+# Skill phrases are compiled once into a trie over word tokens. The text is
+# tokenized in one regex pass (runs of [a-z0-9] or single punctuation
+# characters), and the trie is walked from each token, so matches always sit
+# on word boundaries:
+#   "java" does not match inside "javascript", "r" does not match "resume".
+# Adjacency inside a phrase is kept exact: "scikit-learn" needs the hyphen
+# with no spaces, while any run of whitespace matches the space in
+# "machine learning".
+#
+# This replaces the character-level Aho-Corasick automaton the matcher
+# started out with. Both report exactly the same (skill, start, end)
+# matches: a phrase only matches where it starts and ends on a token
+# boundary, so the automaton's failure links (which find patterns
+# starting mid-word, later rejected by its boundary check) are never
+# needed, and walking the trie from each token finds every overlapping
+# match the automaton did. The inner loop runs per token instead of per
+# character, which is several times faster in pure Python. The only
+# observable difference is ordering: find_all() is sorted by start offset
+# rather than end offset; counts() is unaffected.
+
+import re
+
+# (leading whitespace, token)
+_TOKEN_RE = re.compile(r"(\s*)([a-z0-9]+|[^a-z0-9\s])")
+
+
+def tokenize(low: str):
+    """[(leading whitespace, token)] for lowercase text, as the matcher sees it."""
+    return _TOKEN_RE.findall(low)
+
+
+def _edge(ws: str, token: str) -> str:
+    """Trie edge label: tokens preceded by whitespace get a leading space."""
+    return " " + token if ws else token
+
+
+class SkillMatch:
+    __slots__ = ("skill", "start", "end")
+
+    def __init__(self, skill, start, end):
+        self.skill = skill
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"SkillMatch({self.skill!r}, {self.start}, {self.end})"
+
+
+class SkillMatcher:
+
+    def __init__(self, patterns):
+        """
+        `patterns` is an iterable of skill phrases, or a mapping of
+        phrase -> canonical skill name (for aliases / synonyms).
+        """
+        if not hasattr(patterns, "items"):
+            patterns = {p: p for p in patterns}
+
+        # node = [children {edge: node}, canonical name or None]
+        self._root = {}
+        self._size = 0
+        for phrase, canonical in patterns.items():
+            tokens = _TOKEN_RE.findall(phrase.lower().strip())
+            if tokens:
+                self._add(tokens, canonical)
+
+    def _add(self, tokens, canonical):
+        children = self._root
+        node = None
+        for i, (ws, token) in enumerate(tokens):
+            key = token if i == 0 else _edge(ws, token)
+            node = children.get(key)
+            if node is None:
+                node = [{}, None]
+                children[key] = node
+                self._size += 1
+            children = node[0]
+        node[1] = canonical
+
+    def __len__(self):
+        return self._size
+
+    # ------------ Matching ------------ #
+
+    def _walk(self, tokens):
+        """Yield (canonical, first token index, last token index)."""
+        root = self._root
+        n = len(tokens)
+        for i in range(n):
+            node = root.get(tokens[i][1])
+            j = i
+            while node is not None:
+                if node[1] is not None:
+                    yield node[1], i, j
+                j += 1
+                if j >= n or not node[0]:
+                    break
+                ws, token = tokens[j]
+                node = node[0].get(_edge(ws, token))
+
+    def finditer(self, text: str, lowered: bool = False):
+        """
+        Yield a SkillMatch (canonical name, start, end offsets) for every
+        word-bounded occurrence. Pass lowered=True if `text` is already
+        lowercase.
+        """
+        if not text:
+            return
+        low = text if lowered else text.lower()
+        spans = []
+        tokens = []
+        for m in _TOKEN_RE.finditer(low):
+            spans.append((m.start(2), m.end(2)))
+            tokens.append(m.groups())
+        for canonical, i, j in self._walk(tokens):
+            yield SkillMatch(canonical, spans[i][0], spans[j][1])
+
+    def find_all(self, text: str, lowered: bool = False):
+        """List of SkillMatch objects, in order of start offset."""
+        return list(self.finditer(text, lowered=lowered))
+
+    def counts(self, text: str, lowered: bool = False):
+        """{canonical skill: number of occurrences}."""
+        if not text:
+            return {}
+        return self.count_tokens(tokenize(text if lowered else text.lower()))
+
+    def count_tokens(self, tokens):
+        """counts() on the output of tokenize(), for callers that reuse the tokens."""
+        counts = {}
+        for canonical, _, _ in self._walk(tokens):
+            counts[canonical] = counts.get(canonical, 0) + 1
+        return counts
@@ -1,41 +1,115 @@
 # utils/skills.py
 
-# Basic skill dictionary (you can expand this later)
-SKILL_SET = {
-    # Programming
-    "python", "java", "c++", "c#", "javascript", "typescript",
-    "r", "sql", "nosql", "scala",
+import json
+import os
 
-    # Data / ML
-    "machine learning", "deep learning", "nlp", "computer vision",
-    "predictive analytics", "data mining",
+from utils.skill_matcher import SkillMatcher
 
-    # Libraries / Tools
-    "pandas", "numpy", "matplotlib", "seaborn", "scikit-learn",
-    "tensorflow", "pytorch",
+# ------------------------------------------
+# Skill taxonomy
+# ------------------------------------------
+# Canonical skills, categories and aliases live in a JSON or CSV file:
+#   JSON: {"skills": [{"name": "scikit-learn", "category": "...", "aliases": ["sklearn"]}]}
+#   CSV:  skill,category,aliases      (aliases separated by "|")
+# Override the default with RESUME_SKILL_TAXONOMY=/path/to/taxonomy.{json,csv}
 
-    # BI Tools
-    "power bi", "tableau", "looker studio",
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_TAXONOMY_PATH = os.path.join(DATA_DIR, "skills_taxonomy.json")
+TAXONOMY_PATH = os.environ.get("RESUME_SKILL_TAXONOMY") or DEFAULT_TAXONOMY_PATH
 
-    # Cloud
-    "aws", "azure", "gcp", "snowflake", "databricks",
 
-    # Databases
-    "mysql", "postgresql", "mongodb", "oracle",
+def load_taxonomy(path: str):
+    """Return {canonical skill: {"category": str, "aliases": [str]}}."""
+    taxonomy = {}
+    if path.lower().endswith(".csv"):
+        import csv
+
+        with open(path, "r", encoding="utf-8", newline="") as fh:
+            for row in csv.DictReader(fh):
+                name = row["skill"].strip().lower()
+                aliases = [a.strip().lower() for a in (row.get("aliases") or "").split("|") if a.strip()]
+                taxonomy[name] = {"category": (row.get("category") or "").strip(), "aliases": aliases}
+    else:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        for entry in data["skills"]:
+            name = entry["name"].strip().lower()
+            taxonomy[name] = {
+                "category": entry.get("category", ""),
+                "aliases": [a.strip().lower() for a in entry.get("aliases", [])],
+            }
+    return taxonomy
+
+
+SKILL_TAXONOMY = load_taxonomy(TAXONOMY_PATH)
+
+# Canonical skill names (kept for backwards compatibility)
+SKILL_SET = set(SKILL_TAXONOMY)
+
+SKILL_CATEGORIES = {name: info["category"] for name, info in SKILL_TAXONOMY.items()}
+
+# Every surface form (canonical name or alias) -> canonical name
+SKILL_ALIASES = {}
+for _name, _info in SKILL_TAXONOMY.items():
+    for _alias in _info["aliases"]:
+        SKILL_ALIASES[" ".join(_alias.split())] = _name
+    SKILL_ALIASES[_name] = _name
+
+
+_taxonomy_hash = None
+
+
+def taxonomy_hash() -> str:
+    """SHA-256 of the taxonomy file; identifies it for caches of derived data."""
+    global _taxonomy_hash
+    if _taxonomy_hash is None:
+        import hashlib  # ~4 ms to import; only callers that cache need it
+
+        with open(TAXONOMY_PATH, "rb") as fh:
+            _taxonomy_hash = hashlib.sha256(fh.read()).hexdigest()
+    return _taxonomy_hash
+
+
+def canonicalize_skill(skill: str) -> str:
+    """Map an alias ("sklearn") to its canonical skill ("scikit-learn")."""
+    key = " ".join(str(skill).lower().split())
+    return SKILL_ALIASES.get(key, key)
+
+
+def canonicalize_skills(skills):
+    """Sorted, de-duplicated canonical names for a list of skills."""
+    return sorted({canonicalize_skill(s) for s in skills or []})
+
+
+# ------------------------------------------
+# Matcher
+# ------------------------------------------
+# Compiling the trie takes about as long as loading any serialized copy of
+# it would, so it is simply built in-process on first use
+_matcher = None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """The compiled matcher for the skill taxonomy, built once on first use."""
+    global _matcher
+    if _matcher is None:
+        _matcher = SkillMatcher(SKILL_ALIASES)
+    return _matcher
+
+
+def find_skills(text: str):
+    """Every skill occurrence in `text` as SkillMatch(skill, start, end)."""
+    return get_skill_matcher().find_all(text or "")
+
+
+def skill_counts(text: str):
+    """{canonical skill: number of occurrences} for `text`."""
+    return get_skill_matcher().counts(text or "")
 
-    # Soft skills
-    "problem solving", "communication", "leadership",
-}
 
 def extract_skills(text: str):
     """
-    Extract skills from text using simple keyword matching.
+    Extract canonical skills from text with a single word-bounded pass
+    (aliases such as "sklearn" are reported as "scikit-learn").
     """
-    text_lower = text.lower()
-    found = []
-
-    for skill in SKILL_SET:
-        if skill in text_lower:
-            found.append(skill)
-
-    return sorted(list(set(found)))
\ No newline at end of file
+    return sorted(skill_counts(text))
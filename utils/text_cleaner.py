@@ -1,20 +1,47 @@
+import os
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
+from functools import lru_cache
+from utils.lemmatizer import lemmatize
 
-nltk.download('stopwords')
-nltk.download('wordnet')
+# Vendored NLTK English stopword list: no nltk.download, no network access
+_STOPWORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "stopwords_english.txt")
+
+with open(_STOPWORDS_FILE, "r", encoding="utf-8") as _fh:
+    stop_words = frozenset(_fh.read().split())
+
+_TAG_RE = re.compile(r"<.*?>")
+_WORD_RE = re.compile(r"[a-zA-Z]+")
+
+# Resume vocabulary is highly repetitive, so most tokens hit this cache
+TOKEN_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _normalize_token(token: str):
+    """Lowercased lemma of one ASCII-letter token, or None for stopwords."""
+    token = token.lower()
+    if token in stop_words:
+        return None
+    return lemmatize(token)
 
-stop_words = set(stopwords.words("english"))
-lemmatizer = WordNetLemmatizer()
 
 def clean_text(text: str) -> str:
+    """
+    Strip HTML tags, keep letters only, lowercase, drop stopwords, lemmatize.
+    One regex pass tokenizes; per-token work is memoized.
+    """
     if not isinstance(text, str):
         return ""
-    text = re.sub(r'<.*?>', ' ', text)
-    text = re.sub(r'[^a-zA-Z]', ' ', text)
-    text = text.lower()
-    tokens = text.split()
-    tokens = [lemmatizer.lemmatize(w) for w in tokens if w not in stop_words]
-    return " ".join(tokens)
\ No newline at end of file
+    if "<" in text:
+        text = _TAG_RE.sub(" ", text)
+    return clean_words(_WORD_RE.findall(text))
+
+
+def clean_words(words) -> str:
+    """clean_text() for text that is already split into ASCII-letter words."""
+    return " ".join(t for t in map(_normalize_token, words) if t)
+
+
+def clean_many(texts):
+    """clean_text over many texts, sharing the token cache."""
+    return [clean_text(t) for t in texts]